@@ -6,14 +6,7 @@ OpenViking - An Agent-native context database
 Data in, Context out.
 """
 
-from openviking.async_client import AsyncOpenViking
-from openviking.client.http import AsyncHTTPClient
-from openviking.client.sync_http import SyncHTTPClient
-from openviking.session import Session
-from openviking.session.user_id import UserIdentifier
-from openviking.sync_client import SyncOpenViking
-
-OpenViking = SyncOpenViking
+import importlib
 
 try:
     from ._version import version as __version__
@@ -25,12 +18,20 @@ except ImportError:
     except ImportError:
         __version__ = "0.0.0+unknown"
 
-try:
-    from pyagfs import AGFSClient
-except ImportError:
-    raise ImportError(
-        "pyagfs not found. Please install: pip install -e third_party/agfs/agfs-sdk/python"
-    )
+# Public attributes are resolved on first access (PEP 562) so that
+# `import openviking` does not pull in httpx, the storage stack or AGFS bindings.
+_LAZY = {
+    "AsyncOpenViking": "openviking.async_client",
+    "SyncOpenViking": "openviking.sync_client",
+    "OpenViking": "openviking.sync_client",
+    "AsyncHTTPClient": "openviking.client.http",
+    "SyncHTTPClient": "openviking.client.sync_http",
+    "Session": "openviking.session",
+    "UserIdentifier": "openviking.session.user_id",
+}
+
+# Attributes whose modules depend on the AGFS SDK being installed.
+_AGFS_REQUIRED = {"AsyncOpenViking", "SyncOpenViking", "OpenViking", "Session"}
 
 __all__ = [
     "OpenViking",
@@ -41,3 +42,29 @@ __all__ = [
     "Session",
     "UserIdentifier",
 ]
+
+
+def __getattr__(name: str):
+    if name == "AGFSClient":
+        from openviking.utils.agfs_utils import require_agfs
+
+        attr = require_agfs()
+        globals()[name] = attr
+        return attr
+
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if name in _AGFS_REQUIRED:
+        from openviking.utils.agfs_utils import require_agfs
+
+        require_agfs()
+
+    module = importlib.import_module(_LAZY[name])
+    attr = getattr(module, "SyncOpenViking" if name == "OpenViking" else name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -35,7 +35,6 @@ from openviking.exceptions import (
 )
 from openviking.retrieve.types import FindResult
 from openviking.session.user_id import UserIdentifier
-from openviking.utils import run_async
 
 # Error code to exception class mapping
 ERROR_CODE_TO_EXCEPTION = {
@@ -60,47 +59,33 @@ class _HTTPObserver:
     """Observer proxy for HTTP mode.
 
     Provides the same interface as the local observer but fetches data via HTTP.
+    Properties are synchronous, so they use the client's blocking HTTP connection
+    rather than the httpx.AsyncClient bound to the caller's event loop.
     """
 
     def __init__(self, client: "AsyncHTTPClient"):
         self._client = client
         self._cache = {}
 
-    async def _fetch_queue_status(self) -> Dict[str, Any]:
-        """Fetch queue status asynchronously."""
-        return await self._client._get_queue_status()
-
-    async def _fetch_vikingdb_status(self) -> Dict[str, Any]:
-        """Fetch VikingDB status asynchronously."""
-        return await self._client._get_vikingdb_status()
-
-    async def _fetch_vlm_status(self) -> Dict[str, Any]:
-        """Fetch VLM status asynchronously."""
-        return await self._client._get_vlm_status()
-
-    async def _fetch_system_status(self) -> Dict[str, Any]:
-        """Fetch system status asynchronously."""
-        return await self._client._get_system_status()
-
     @property
     def queue(self) -> Dict[str, Any]:
-        """Get queue system status (sync wrapper)."""
-        return run_async(self._fetch_queue_status())
+        """Get queue system status."""
+        return self._client._request_sync("GET", "/api/v1/observer/queue")
 
     @property
     def vikingdb(self) -> Dict[str, Any]:
-        """Get VikingDB status (sync wrapper)."""
-        return run_async(self._fetch_vikingdb_status())
+        """Get VikingDB status."""
+        return self._client._request_sync("GET", "/api/v1/observer/vikingdb")
 
     @property
     def vlm(self) -> Dict[str, Any]:
-        """Get VLM status (sync wrapper)."""
-        return run_async(self._fetch_vlm_status())
+        """Get VLM status."""
+        return self._client._request_sync("GET", "/api/v1/observer/vlm")
 
     @property
     def system(self) -> Dict[str, Any]:
-        """Get system overall status (sync wrapper)."""
-        return run_async(self._fetch_system_status())
+        """Get system overall status."""
+        return self._client._request_sync("GET", "/api/v1/observer/system")
 
     def is_healthy(self) -> bool:
         """Check if system is healthy."""
@@ -148,18 +133,22 @@ class AsyncHTTPClient(BaseClient):
         self._api_key = api_key
         self._user = UserIdentifier.the_default_user()
         self._http: Optional[httpx.AsyncClient] = None
+        self._sync_http: Optional[httpx.Client] = None
         self._observer: Optional[_HTTPObserver] = None
 
     # ============= Lifecycle =============
 
-    async def initialize(self) -> None:
-        """Initialize the HTTP client."""
+    def _headers(self) -> Dict[str, str]:
         headers = {}
         if self._api_key:
             headers["X-API-Key"] = self._api_key
+        return headers
+
+    async def initialize(self) -> None:
+        """Initialize the HTTP client."""
         self._http = httpx.AsyncClient(
             base_url=self._url,
-            headers=headers,
+            headers=self._headers(),
             timeout=60.0,
         )
         self._observer = _HTTPObserver(self)
@@ -169,9 +158,22 @@ class AsyncHTTPClient(BaseClient):
         if self._http:
             await self._http.aclose()
             self._http = None
+        if self._sync_http:
+            self._sync_http.close()
+            self._sync_http = None
 
     # ============= Internal Helpers =============
 
+    def _request_sync(self, method: str, path: str, **kwargs) -> Any:
+        """Blocking request for the synchronous API, independent of any event loop."""
+        if self._sync_http is None:
+            self._sync_http = httpx.Client(
+                base_url=self._url,
+                headers=self._headers(),
+                timeout=60.0,
+            )
+        return self._handle_response(self._sync_http.request(method, path, **kwargs))
+
     def _handle_response(self, response: httpx.Response) -> Any:
         """Handle HTTP response and extract result or raise exception."""
         try:
@@ -556,7 +558,8 @@ class AsyncHTTPClient(BaseClient):
         from openviking.client.session import Session
 
         if not session_id:
-            result = run_async(self.create_session())
+            # Blocking client, the async one is bound to the caller's loop
+            result = self._request_sync("POST", "/api/v1/sessions", json={})
             session_id = result.get("session_id", "")
         return Session(self, session_id, self._user)
 
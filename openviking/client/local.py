@@ -8,6 +8,7 @@ Implements BaseClient interface using direct service calls (embedded mode).
 from typing import Any, Dict, List, Optional, Union
 
 from openviking.client.base import BaseClient
+from openviking.message import TextPart
 from openviking.service import OpenVikingService
 from openviking.session.user_id import UserIdentifier
 from openviking.utils.config import OpenVikingConfig
@@ -159,7 +160,7 @@ class LocalClient(BaseClient):
         session = None
         if session_id:
             session = self._service.sessions.session(session_id)
-            session.load()
+            await session.load_async()
         return await self._service.search.search(
             query=query,
             target_uri=target_uri,
@@ -208,7 +209,7 @@ class LocalClient(BaseClient):
     async def get_session(self, session_id: str) -> Dict[str, Any]:
         """Get session details."""
         session = self._service.sessions.session(session_id)
-        session.load()
+        await session.load_async()
         return {
             "session_id": session.session_id,
             "user": session.user.to_dict(),
@@ -226,8 +227,8 @@ class LocalClient(BaseClient):
     async def add_message(self, session_id: str, role: str, content: str) -> Dict[str, Any]:
         """Add a message to a session."""
         session = self._service.sessions.session(session_id)
-        session.load()
-        session.add_message(role, content)
+        await session.load_async()
+        await session.add_message_async(role, [TextPart(text=content)])
         return {
             "session_id": session_id,
             "message_count": len(session.messages),
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
 from openviking.client.http import AsyncHTTPClient
 from openviking.utils import run_async
+from openviking.utils.async_utils import _get_loop
 
 
 class SyncHTTPClient:
@@ -36,49 +37,58 @@ class SyncHTTPClient:
         api_key: Optional[str] = None,
     ):
         self._async_client = AsyncHTTPClient(url=url, api_key=api_key)
+        # Async clients are bound to the loop they were created on, so every call from
+        # any thread runs on this one
+        self._loop = _get_loop()
         self._initialized = False
 
+    def _run(self, coro):
+        """Run coroutine on the loop this client is bound to."""
+        return run_async(coro, loop=self._loop)
+
     # ============= Lifecycle =============
 
     def initialize(self) -> None:
         """Initialize the HTTP client."""
-        run_async(self._async_client.initialize())
+        self._run(self._async_client.initialize())
         self._initialized = True
 
     def close(self) -> None:
         """Close the HTTP client and release resources."""
-        run_async(self._async_client.close())
+        self._run(self._async_client.close())
         self._initialized = False
 
     # ============= Session =============
 
     def session(self, session_id: Optional[str] = None) -> "Session":
         """Create new session or load existing session."""
+        if not session_id:
+            session_id = self._run(self._async_client.create_session()).get("session_id", "")
         return self._async_client.session(session_id)
 
     def create_session(self) -> Dict[str, Any]:
         """Create a new session."""
-        return run_async(self._async_client.create_session())
+        return self._run(self._async_client.create_session())
 
     def list_sessions(self) -> List[Any]:
         """List all sessions."""
-        return run_async(self._async_client.list_sessions())
+        return self._run(self._async_client.list_sessions())
 
     def get_session(self, session_id: str) -> Dict[str, Any]:
         """Get session details."""
-        return run_async(self._async_client.get_session(session_id))
+        return self._run(self._async_client.get_session(session_id))
 
     def delete_session(self, session_id: str) -> None:
         """Delete a session."""
-        run_async(self._async_client.delete_session(session_id))
+        self._run(self._async_client.delete_session(session_id))
 
     def add_message(self, session_id: str, role: str, content: str) -> Dict[str, Any]:
         """Add a message to a session."""
-        return run_async(self._async_client.add_message(session_id, role, content))
+        return self._run(self._async_client.add_message(session_id, role, content))
 
     def commit_session(self, session_id: str) -> Dict[str, Any]:
         """Commit a session (archive and extract memories)."""
-        return run_async(self._async_client.commit_session(session_id))
+        return self._run(self._async_client.commit_session(session_id))
 
     # ============= Resource =============
 
@@ -92,7 +102,7 @@ class SyncHTTPClient:
         timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Add resource to OpenViking."""
-        return run_async(
+        return self._run(
             self._async_client.add_resource(path, target, reason, instruction, wait, timeout)
         )
 
@@ -103,11 +113,11 @@ class SyncHTTPClient:
         timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Add skill to OpenViking."""
-        return run_async(self._async_client.add_skill(data, wait=wait, timeout=timeout))
+        return self._run(self._async_client.add_skill(data, wait=wait, timeout=timeout))
 
     def wait_processed(self, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Wait for all processing to complete."""
-        return run_async(self._async_client.wait_processed(timeout))
+        return self._run(self._async_client.wait_processed(timeout))
 
     # ============= Search =============
 
@@ -122,7 +132,7 @@ class SyncHTTPClient:
         filter: Optional[Dict] = None,
     ):
         """Semantic search with optional session context."""
-        return run_async(
+        return self._run(
             self._async_client.search(
                 query=query,
                 target_uri=target_uri,
@@ -143,89 +153,87 @@ class SyncHTTPClient:
         filter: Optional[Dict] = None,
     ):
         """Semantic search without session context."""
-        return run_async(
-            self._async_client.find(query, target_uri, limit, score_threshold, filter)
-        )
+        return self._run(self._async_client.find(query, target_uri, limit, score_threshold, filter))
 
     def grep(self, uri: str, pattern: str, case_insensitive: bool = False) -> Dict:
         """Content search with pattern."""
-        return run_async(self._async_client.grep(uri, pattern, case_insensitive))
+        return self._run(self._async_client.grep(uri, pattern, case_insensitive))
 
     def glob(self, pattern: str, uri: str = "viking://") -> Dict:
         """File pattern matching."""
-        return run_async(self._async_client.glob(pattern, uri))
+        return self._run(self._async_client.glob(pattern, uri))
 
     # ============= File System =============
 
     def ls(self, uri: str, simple: bool = False, recursive: bool = False) -> List[Any]:
         """List directory contents."""
-        return run_async(self._async_client.ls(uri, simple=simple, recursive=recursive))
+        return self._run(self._async_client.ls(uri, simple=simple, recursive=recursive))
 
     def tree(self, uri: str) -> Dict:
         """Get directory tree."""
-        return run_async(self._async_client.tree(uri))
+        return self._run(self._async_client.tree(uri))
 
     def stat(self, uri: str) -> Dict:
         """Get resource status."""
-        return run_async(self._async_client.stat(uri))
+        return self._run(self._async_client.stat(uri))
 
     def mkdir(self, uri: str) -> None:
         """Create directory."""
-        run_async(self._async_client.mkdir(uri))
+        self._run(self._async_client.mkdir(uri))
 
     def rm(self, uri: str, recursive: bool = False) -> None:
         """Remove resource."""
-        run_async(self._async_client.rm(uri, recursive))
+        self._run(self._async_client.rm(uri, recursive))
 
     def mv(self, from_uri: str, to_uri: str) -> None:
         """Move resource."""
-        run_async(self._async_client.mv(from_uri, to_uri))
+        self._run(self._async_client.mv(from_uri, to_uri))
 
     # ============= Content =============
 
     def read(self, uri: str) -> str:
         """Read file content."""
-        return run_async(self._async_client.read(uri))
+        return self._run(self._async_client.read(uri))
 
     def abstract(self, uri: str) -> str:
         """Read L0 abstract."""
-        return run_async(self._async_client.abstract(uri))
+        return self._run(self._async_client.abstract(uri))
 
     def overview(self, uri: str) -> str:
         """Read L1 overview."""
-        return run_async(self._async_client.overview(uri))
+        return self._run(self._async_client.overview(uri))
 
     # ============= Relations =============
 
     def relations(self, uri: str) -> List[Dict[str, Any]]:
         """Get relations for a resource."""
-        return run_async(self._async_client.relations(uri))
+        return self._run(self._async_client.relations(uri))
 
     def link(self, from_uri: str, uris: Union[str, List[str]], reason: str = "") -> None:
         """Create link between resources."""
-        run_async(self._async_client.link(from_uri, uris, reason))
+        self._run(self._async_client.link(from_uri, uris, reason))
 
     def unlink(self, from_uri: str, uri: str) -> None:
         """Remove link between resources."""
-        run_async(self._async_client.unlink(from_uri, uri))
+        self._run(self._async_client.unlink(from_uri, uri))
 
     # ============= Pack =============
 
     def export_ovpack(self, uri: str, to: str) -> str:
         """Export context as .ovpack file."""
-        return run_async(self._async_client.export_ovpack(uri, to))
+        return self._run(self._async_client.export_ovpack(uri, to))
 
     def import_ovpack(
         self, file_path: str, target: str, force: bool = False, vectorize: bool = True
     ) -> str:
         """Import .ovpack file."""
-        return run_async(self._async_client.import_ovpack(file_path, target, force, vectorize))
+        return self._run(self._async_client.import_ovpack(file_path, target, force, vectorize))
 
     # ============= Debug =============
 
     def health(self) -> bool:
         """Check server health."""
-        return run_async(self._async_client.health())
+        return self._run(self._async_client.health())
 
     def get_status(self) -> Dict[str, Any]:
         """Get system status."""
@@ -237,7 +237,10 @@ class DirectoryInitializer:
             )
             context.set_vectorize(Vectorize(text=defn.overview))
             dir_emb_msg = EmbeddingMsgConverter.from_context(context)
-            await self.vikingdb.enqueue_embedding_msg(dir_emb_msg)
+            try:
+                await self.vikingdb.enqueue_embedding_msg(dir_emb_msg)
+            except Exception as e:
+                logger.error(f"Failed to enqueue directory {uri} for vectorization: {e}")
             created = True
         return created
 
@@ -183,6 +183,10 @@ class OpenVikingService:
         if self._embedder is None:
             self._embedder = self._config.embedding.get_embedder()
 
+        # Queue handlers must be registered before resources are enqueued. warmup() is
+        # left to callers, its probe embed is a billable remote call.
+        self._vikingdb_manager._ensure_queues()
+
         config = get_openviking_config()
 
         # Create context collection
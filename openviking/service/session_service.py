@@ -128,8 +128,8 @@ class SessionService:
         """
         self._ensure_initialized()
         session = self.session(session_id)
-        session.load()
-        return session.commit()
+        await session.load_async()
+        return await session.commit_async()
 
     async def extract(self, session_id: str) -> List[Any]:
         """Extract memories from a session.
@@ -145,7 +145,7 @@ class SessionService:
             raise NotInitializedError("SessionCompressor")
 
         session = self.session(session_id)
-        session.load()
+        await session.load_async()
 
         return await self._session_compressor.extract_long_term_memories(
             messages=session.messages,
@@ -59,9 +59,14 @@ class SessionCompressor:
         from openviking.storage.queuefs.embedding_msg_converter import EmbeddingMsgConverter
 
         embedding_msg = EmbeddingMsgConverter.from_context(memory)
-        await self.vikingdb.enqueue_embedding_msg(embedding_msg)
-        logger.info(f"Enqueued memory for vectorization: {memory.uri}")
-        return True
+        try:
+            enqueued = await self.vikingdb.enqueue_embedding_msg(embedding_msg)
+        except Exception as e:
+            logger.error(f"Failed to enqueue memory for vectorization: {memory.uri}: {e}")
+            return False
+        if enqueued:
+            logger.info(f"Enqueued memory for vectorization: {memory.uri}")
+        return enqueued
 
     async def extract_long_term_memories(
         self,
@@ -90,12 +90,17 @@ class Session:
         logger.info(f"Session created: {self.session_id} for user {self.user}")
 
     def load(self):
+        """Load session data from storage."""
+        if not self._loaded:
+            run_async(self.load_async())
+
+    async def load_async(self):
         """Load session data from storage."""
         if self._loaded:
             return
 
         try:
-            content = run_async(self._viking_fs.read_file(f"{self._session_uri}/messages.jsonl"))
+            content = await self._viking_fs.read_file(f"{self._session_uri}/messages.jsonl")
             self._messages = [
                 Message.from_dict(json.loads(line))
                 for line in content.strip().split("\n")
@@ -107,7 +112,7 @@ class Session:
 
         # Restore compression_index (scan history directory)
         try:
-            history_items = run_async(self._viking_fs.ls(f"{self._session_uri}/history"))
+            history_items = await self._viking_fs.ls(f"{self._session_uri}/history")
             archives = [
                 item["name"] for item in history_items if item["name"].startswith("archive_")
             ]
@@ -157,6 +162,14 @@ class Session:
         self,
         role: str,
         parts: List[Part],
+    ) -> Message:
+        """Add a message."""
+        return run_async(self.add_message_async(role, parts))
+
+    async def add_message_async(
+        self,
+        role: str,
+        parts: List[Part],
     ) -> Message:
         """Add a message."""
         msg = Message(
@@ -172,7 +185,7 @@ class Session:
             self._stats.total_turns += 1
         self._stats.total_tokens += len(msg.content) // 4
 
-        self._append_to_jsonl(msg)
+        await self._append_to_jsonl(msg)
         return msg
 
     def update_tool_part(
@@ -181,6 +194,16 @@ class Session:
         tool_id: str,
         output: str,
         status: str = "completed",
+    ) -> None:
+        """Update tool status."""
+        run_async(self.update_tool_part_async(message_id, tool_id, output, status))
+
+    async def update_tool_part_async(
+        self,
+        message_id: str,
+        tool_id: str,
+        output: str,
+        status: str = "completed",
     ) -> None:
         """Update tool status."""
         msg = next((m for m in self._messages if m.id == message_id), None)
@@ -194,10 +217,14 @@ class Session:
         tool_part.tool_output = output
         tool_part.tool_status = status
 
-        self._save_tool_result(tool_id, msg, output, status)
-        self._update_message_in_jsonl()
+        await self._save_tool_result(tool_id, msg, output, status)
+        await self._update_message_in_jsonl()
 
     def commit(self) -> Dict[str, Any]:
+        """Commit session: create archive, extract memories, persist."""
+        return run_async(self.commit_async())
+
+    async def commit_async(self) -> Dict[str, Any]:
         """Commit session: create archive, extract memories, persist."""
         result = {
             "session_id": self.session_id,
@@ -214,11 +241,11 @@ class Session:
         self._compression.compression_index += 1
         messages_to_archive = self._messages.copy()
 
-        summary = self._generate_archive_summary(messages_to_archive)
+        summary = await self._generate_archive_summary(messages_to_archive)
         archive_abstract = self._extract_abstract_from_summary(summary)
         archive_overview = summary
 
-        self._write_archive(
+        await self._write_archive(
             index=self._compression.compression_index,
             messages=messages_to_archive,
             abstract=archive_abstract,
@@ -238,25 +265,23 @@ class Session:
             logger.info(
                 f"Starting memory extraction from {len(messages_to_archive)} archived messages"
             )
-            memories = run_async(
-                self._session_compressor.extract_long_term_memories(
-                    messages=messages_to_archive,
-                    user=self.user,
-                    session_id=self.session_id,
-                )
+            memories = await self._session_compressor.extract_long_term_memories(
+                messages=messages_to_archive,
+                user=self.user,
+                session_id=self.session_id,
             )
             logger.info(f"Extracted {len(memories)} memories")
             result["memories_extracted"] = len(memories)
             self._stats.memories_extracted += len(memories)
 
         # 3. Write current messages to AGFS
-        self._write_to_agfs(self._messages)
+        await self._write_to_agfs(self._messages)
 
         # 4. Create relations
-        self._write_relations()
+        await self._write_relations()
 
         # 5. Update active_count
-        active_count_updated = self._update_active_counts()
+        active_count_updated = await self._update_active_counts()
         result["active_count_updated"] = active_count_updated
 
         # 6. Update statistics
@@ -272,7 +297,7 @@ class Session:
         logger.info(f"Session {self.session_id} committed")
         return result
 
-    def _update_active_counts(self) -> int:
+    async def _update_active_counts(self) -> int:
         """Update active_count for used contexts/skills."""
         if not self._vikingdb_manager:
             return 0
@@ -282,12 +307,10 @@ class Session:
 
         for usage in self._usage_records:
             try:
-                run_async(
-                    storage.update(
-                        collection="context",
-                        filter={"uri": usage.uri},
-                        update={"$inc": {"active_count": 1}},
-                    )
+                await storage.update(
+                    collection="context",
+                    filter={"uri": usage.uri},
+                    update={"$inc": {"active_count": 1}},
                 )
                 updated += 1
             except Exception as e:
@@ -299,6 +322,12 @@ class Session:
 
     def get_context_for_search(
         self, query: str, max_archives: int = 3, max_messages: int = 20
+    ) -> Dict[str, Any]:
+        """Get session context for intent analysis, see get_context_for_search_async()."""
+        return run_async(self.get_context_for_search_async(query, max_archives, max_messages))
+
+    async def get_context_for_search_async(
+        self, query: str, max_archives: int = 3, max_messages: int = 20
     ) -> Dict[str, Any]:
         """Get session context for intent analysis.
 
@@ -318,7 +347,7 @@ class Session:
         summaries = []
         if self.compression.compression_index > 0:
             try:
-                history_items = run_async(self._viking_fs.ls(f"{self._session_uri}/history"))
+                history_items = await self._viking_fs.ls(f"{self._session_uri}/history")
                 query_lower = query.lower()
 
                 # Collect all archives with relevance scores
@@ -328,7 +357,7 @@ class Session:
                     if name and name.startswith("archive_"):
                         overview_uri = f"{self._session_uri}/history/{name}/.overview.md"
                         try:
-                            overview = run_async(self._viking_fs.read_file(overview_uri))
+                            overview = await self._viking_fs.read_file(overview_uri)
                             # Calculate relevance by keyword matching
                             score = 0
                             if query_lower in overview.lower():
@@ -365,7 +394,7 @@ class Session:
         first_line = summary.split("\n")[0].strip()
         return first_line if first_line else ""
 
-    def _generate_archive_summary(self, messages: List[Message]) -> str:
+    async def _generate_archive_summary(self, messages: List[Message]) -> str:
         """Generate structured summary for archive."""
         if not messages:
             return ""
@@ -381,14 +410,14 @@ class Session:
                     "compression.structured_summary",
                     {"messages": formatted},
                 )
-                return run_async(vlm.get_completion_async(prompt))
+                return await vlm.get_completion_async(prompt)
             except Exception as e:
                 logger.warning(f"LLM summary failed: {e}")
 
         turn_count = len([m for m in messages if m.role == "user"])
         return f"# Session Summary\n\n**Overview**: {turn_count} turns, {len(messages)} messages"
 
-    def _write_archive(
+    async def _write_archive(
         self,
         index: int,
         messages: List[Message],
@@ -404,19 +433,17 @@ class Session:
 
         # Write messages.jsonl
         lines = [m.to_jsonl() for m in messages]
-        run_async(
-            viking_fs.write_file(
-                uri=f"{archive_uri}/messages.jsonl",
-                content="\n".join(lines) + "\n",
-            )
+        await viking_fs.write_file(
+            uri=f"{archive_uri}/messages.jsonl",
+            content="\n".join(lines) + "\n",
         )
 
-        run_async(viking_fs.write_file(uri=f"{archive_uri}/.abstract.md", content=abstract))
-        run_async(viking_fs.write_file(uri=f"{archive_uri}/.overview.md", content=overview))
+        await viking_fs.write_file(uri=f"{archive_uri}/.abstract.md", content=abstract)
+        await viking_fs.write_file(uri=f"{archive_uri}/.overview.md", content=overview)
 
         logger.debug(f"Written archive: {archive_uri}")
 
-    def _write_to_agfs(self, messages: List[Message]) -> None:
+    async def _write_to_agfs(self, messages: List[Message]) -> None:
         """Write messages.jsonl to AGFS."""
         if not self._viking_fs:
             return
@@ -430,53 +457,43 @@ class Session:
         lines = [m.to_jsonl() for m in messages]
         content = "\n".join(lines) + "\n" if lines else ""
 
-        run_async(
-            viking_fs.write_file(
-                uri=f"{self._session_uri}/messages.jsonl",
-                content=content,
-            )
+        await viking_fs.write_file(
+            uri=f"{self._session_uri}/messages.jsonl",
+            content=content,
         )
 
         # Update L0/L1
-        run_async(
-            viking_fs.write_file(
-                uri=f"{self._session_uri}/.abstract.md",
-                content=abstract,
-            )
+        await viking_fs.write_file(
+            uri=f"{self._session_uri}/.abstract.md",
+            content=abstract,
         )
-        run_async(
-            viking_fs.write_file(
-                uri=f"{self._session_uri}/.overview.md",
-                content=overview,
-            )
+        await viking_fs.write_file(
+            uri=f"{self._session_uri}/.overview.md",
+            content=overview,
         )
 
-    def _append_to_jsonl(self, msg: Message) -> None:
+    async def _append_to_jsonl(self, msg: Message) -> None:
         """Append to messages.jsonl."""
         if not self._viking_fs:
             return
-        run_async(
-            self._viking_fs.append_file(
-                f"{self._session_uri}/messages.jsonl",
-                msg.to_jsonl() + "\n",
-            )
+        await self._viking_fs.append_file(
+            f"{self._session_uri}/messages.jsonl",
+            msg.to_jsonl() + "\n",
         )
 
-    def _update_message_in_jsonl(self) -> None:
+    async def _update_message_in_jsonl(self) -> None:
         """Update message in messages.jsonl."""
         if not self._viking_fs:
             return
 
         lines = [m.to_jsonl() for m in self._messages]
         content = "\n".join(lines) + "\n"
-        run_async(
-            self._viking_fs.write_file(
-                f"{self._session_uri}/messages.jsonl",
-                content,
-            )
+        await self._viking_fs.write_file(
+            f"{self._session_uri}/messages.jsonl",
+            content,
         )
 
-    def _save_tool_result(
+    async def _save_tool_result(
         self,
         tool_id: str,
         msg: Message,
@@ -500,11 +517,9 @@ class Session:
             "status": status,
             "time": {"created": datetime.now().isoformat()},
         }
-        run_async(
-            self._viking_fs.write_file(
-                f"{self._session_uri}/tools/{tool_id}/tool.json",
-                json.dumps(tool_data, ensure_ascii=False),
-            )
+        await self._viking_fs.write_file(
+            f"{self._session_uri}/tools/{tool_id}/tool.json",
+            json.dumps(tool_data, ensure_ascii=False),
         )
 
     def _generate_abstract(self) -> str:
@@ -539,7 +554,7 @@ class Session:
             parts.append(f"- Historical archives: `{self._session_uri}/history/`")
         return "\n".join(parts)
 
-    def _write_relations(self) -> None:
+    async def _write_relations(self) -> None:
         """Create relations to used contexts/tools."""
         if not self._viking_fs:
             return
@@ -547,7 +562,7 @@ class Session:
         viking_fs = self._viking_fs
         for usage in self._usage_records:
             try:
-                run_async(viking_fs.link(self._session_uri, usage.uri))
+                await viking_fs.link(self._session_uri, usage.uri)
                 logger.debug(f"Created relation: {self._session_uri} -> {usage.uri}")
             except Exception as e:
                 logger.warning(f"Failed to create relation to {usage.uri}: {e}")
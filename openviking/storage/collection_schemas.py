@@ -7,8 +7,9 @@ Provides centralized schema definitions and factory functions for creating colle
 similar to how init_viking_fs encapsulates VikingFS initialization.
 """
 
+import asyncio
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from openviking.models.embedder.base import EmbedResult
 from openviking.storage.queuefs.embedding_msg import EmbeddingMsg
@@ -89,13 +90,24 @@ class TextEmbeddingHandler(DequeueHandlerBase):
     and writes the complete data including vector to the vector database.
 
     Supports both dense and sparse embeddings based on configuration.
+    Batches from the queue worker are embedded in chunks of the configured
+    embedding batch_size via embed_batch, and written with batch_insert.
     """
 
-    def __init__(self, vikingdb: VikingDBInterface):
+    def __init__(
+        self,
+        vikingdb: VikingDBInterface,
+        embed_workers: int = 1,
+        upsert_batch_size: int = 64,
+        pipeline_queue_size: int = 4,
+    ):
         """Initialize the text embedding handler.
 
         Args:
             vikingdb: VikingDBInterface instance for writing to vector database
+            embed_workers: Number of concurrent embed_batch calls per dequeued batch
+            upsert_batch_size: Maximum number of records per batch_insert call
+            pipeline_queue_size: Bound of the queues between pipeline stages
         """
         from openviking.utils.config import get_openviking_config
 
@@ -104,11 +116,77 @@ class TextEmbeddingHandler(DequeueHandlerBase):
         config = get_openviking_config()
         self._collection_name = config.storage.vectordb.name
         self._vector_dim = config.embedding.dimension
+        self._embed_batch_size = max(1, config.embedding.batch_size)
+        self._embed_workers = max(1, embed_workers)
+        self._upsert_batch_size = max(1, upsert_batch_size)
+        self._pipeline_queue_size = max(1, pipeline_queue_size)
         self._initialize_embedder(config)
 
     def _initialize_embedder(self, config: "OpenVikingConfig"):
-        """Initialize the embedder instance from config."""
-        self._embedder = config.embedding.get_embedder()
+        """Initialize the embedder, sharing the backend's cached instance when it has one."""
+        get_embedder = getattr(self._vikingdb, "get_embedder", None)
+        if get_embedder is not None:
+            self._embedder = get_embedder()
+        else:
+            self._embedder = config.embedding.get_embedder()
+
+    def _ensure_embedder(self):
+        """Initialize embedder if not already initialized."""
+        if not self._embedder:
+            from openviking.utils.config import get_openviking_config
+
+            config = get_openviking_config()
+            self._initialize_embedder(config)
+
+    def _apply_embed_result(
+        self, inserted_data: Dict[str, Any], result: EmbedResult, data: Dict[str, Any]
+    ) -> bool:
+        """Add embedding vector(s) to the record, returns False if the result is invalid."""
+        # Add dense vector
+        if result.dense_vector:
+            inserted_data["vector"] = result.dense_vector
+            # Validate vector dimension
+            if len(result.dense_vector) != self._vector_dim:
+                error_msg = f"Dense vector dimension mismatch: expected {self._vector_dim}, got {len(result.dense_vector)}"
+                logger.error(error_msg)
+                self.report_error(error_msg, data)
+                return False
+
+        # Add sparse vector if present
+        if result.sparse_vector:
+            inserted_data["sparse_vector"] = result.sparse_vector
+            logger.debug(f"Generated sparse vector with {len(result.sparse_vector)} terms")
+        return True
+
+    async def _write_record(
+        self, inserted_data: Dict[str, Any], data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Write an embedded record to vector database and report the result."""
+        try:
+            record_id = await self._vikingdb.insert(self._collection_name, inserted_data)
+            if record_id:
+                logger.debug(
+                    f"Successfully wrote embedding to database: {record_id} abstract {inserted_data['abstract']} vector {inserted_data['vector'][:5]}"
+                )
+        except CollectionNotFoundError as db_err:
+            # During shutdown, queue workers may finish one dequeued item.
+            if getattr(self._vikingdb, "is_closing", False):
+                logger.debug(f"Skip embedding write during shutdown: {db_err}")
+                self.report_success()
+                return None
+            logger.error(f"Failed to write to vector database: {db_err}")
+            self.report_error(str(db_err), data)
+            return None
+        except Exception as db_err:
+            logger.error(f"Failed to write to vector database: {db_err}")
+            import traceback
+
+            traceback.print_exc()
+            self.report_error(str(db_err), data)
+            return None
+
+        self.report_success()
+        return inserted_data
 
     async def on_dequeue(self, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Process dequeued message and add embedding vector(s)."""
@@ -127,31 +205,13 @@ class TextEmbeddingHandler(DequeueHandlerBase):
                 self.report_success()
                 return data
 
-            # Initialize embedder if not already initialized
-            if not self._embedder:
-                from openviking.utils.config import get_openviking_config
-
-                config = get_openviking_config()
-                self._initialize_embedder(config)
+            self._ensure_embedder()
 
             # Generate embedding vector(s)
             if self._embedder:
                 result: EmbedResult = self._embedder.embed(embedding_msg.message)
-
-                # Add dense vector
-                if result.dense_vector:
-                    inserted_data["vector"] = result.dense_vector
-                    # Validate vector dimension
-                    if len(result.dense_vector) != self._vector_dim:
-                        error_msg = f"Dense vector dimension mismatch: expected {self._vector_dim}, got {len(result.dense_vector)}"
-                        logger.error(error_msg)
-                        self.report_error(error_msg, data)
-                        return None
-
-                # Add sparse vector if present
-                if result.sparse_vector:
-                    inserted_data["sparse_vector"] = result.sparse_vector
-                    logger.debug(f"Generated sparse vector with {len(result.sparse_vector)} terms")
+                if not self._apply_embed_result(inserted_data, result, data):
+                    return None
             else:
                 error_msg = "Embedder not initialized, skipping vector generation"
                 logger.warning(error_msg)
@@ -159,31 +219,7 @@ class TextEmbeddingHandler(DequeueHandlerBase):
                 return None
 
             # Write to vector database
-            try:
-                record_id = await self._vikingdb.insert(self._collection_name, inserted_data)
-                if record_id:
-                    logger.debug(
-                        f"Successfully wrote embedding to database: {record_id} abstract {inserted_data['abstract']} vector {inserted_data['vector'][:5]}"
-                    )
-            except CollectionNotFoundError as db_err:
-                # During shutdown, queue workers may finish one dequeued item.
-                if getattr(self._vikingdb, "is_closing", False):
-                    logger.debug(f"Skip embedding write during shutdown: {db_err}")
-                    self.report_success()
-                    return None
-                logger.error(f"Failed to write to vector database: {db_err}")
-                self.report_error(str(db_err), data)
-                return None
-            except Exception as db_err:
-                logger.error(f"Failed to write to vector database: {db_err}")
-                import traceback
-
-                traceback.print_exc()
-                self.report_error(str(db_err), data)
-                return None
-
-            self.report_success()
-            return inserted_data
+            return await self._write_record(inserted_data, data)
 
         except Exception as e:
             logger.error(f"Error processing embedding message: {e}")
@@ -192,3 +228,165 @@ class TextEmbeddingHandler(DequeueHandlerBase):
             traceback.print_exc()
             self.report_error(str(e), data)
             return None
+
+    async def _write_records(
+        self,
+        records: List[Tuple[int, Dict[str, Any], Dict[str, Any]]],
+        results: List[Optional[Dict[str, Any]]],
+    ) -> None:
+        """Write a group of embedded records in one batch_insert and report each result."""
+        try:
+            await self._vikingdb.batch_insert(
+                self._collection_name, [inserted_data for _, inserted_data, _ in records]
+            )
+        except CollectionNotFoundError as db_err:
+            # During shutdown, queue workers may finish one dequeued batch.
+            if getattr(self._vikingdb, "is_closing", False):
+                logger.debug(f"Skip embedding write during shutdown: {db_err}")
+                for _ in records:
+                    self.report_success()
+                return
+            logger.error(f"Failed to write to vector database: {db_err}")
+            for _, _, data in records:
+                self.report_error(str(db_err), data)
+            return
+        except Exception as db_err:
+            logger.error(f"Failed to write to vector database: {db_err}")
+            import traceback
+
+            traceback.print_exc()
+            for _, _, data in records:
+                self.report_error(str(db_err), data)
+            return
+
+        logger.debug(f"Successfully wrote {len(records)} embeddings to database")
+        for index, inserted_data, _ in records:
+            self.report_success()
+            results[index] = inserted_data
+
+    async def on_dequeue_batch(
+        self, data_list: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Process a batch of dequeued messages through a prep -> embed -> upsert pipeline.
+
+        Stages are connected by bounded queues of whole chunks: embed workers run embed_batch
+        in a thread so the next chunk is embedded while the previous one is written, and the
+        upsert stage coalesces records into batch_insert calls of upsert_batch_size.
+        Every message is reported exactly once, also when a stage fails.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(data_list)
+        pending: List[Tuple[int, Dict[str, Any], EmbeddingMsg]] = []
+
+        # Prep stage: parse messages and pass non-text ones through
+        for index, data in enumerate(data_list):
+            if not data:
+                continue
+            try:
+                embedding_msg = EmbeddingMsg.from_dict(json.loads(data["data"]))
+            except Exception as e:
+                logger.error(f"Error processing embedding message: {e}")
+                self.report_error(str(e), data)
+                continue
+
+            # Only process string messages
+            if not isinstance(embedding_msg.message, str):
+                logger.debug(f"Skipping non-string message type: {type(embedding_msg.message)}")
+                self.report_success()
+                results[index] = data
+                continue
+            pending.append((index, data, embedding_msg))
+
+        if not pending:
+            return results
+
+        self._ensure_embedder()
+        if not self._embedder:
+            error_msg = "Embedder not initialized, skipping vector generation"
+            logger.warning(error_msg)
+            for _, data, _ in pending:
+                self.report_error(error_msg, data)
+            return results
+
+        loop = asyncio.get_running_loop()
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self._pipeline_queue_size)
+        upsert_queue: asyncio.Queue = asyncio.Queue(maxsize=self._pipeline_queue_size)
+        # Messages not yet reported as success or error, keyed by batch index
+        outstanding: Dict[int, Dict[str, Any]] = {index: data for index, data, _ in pending}
+
+        def fail(indices: List[int], error_msg: str) -> None:
+            for index in indices:
+                data = outstanding.pop(index, None)
+                if data is not None:
+                    self.report_error(error_msg, data)
+
+        async def feed() -> None:
+            for start in range(0, len(pending), self._embed_batch_size):
+                await embed_queue.put(pending[start : start + self._embed_batch_size])
+            for _ in range(self._embed_workers):
+                await embed_queue.put(None)
+
+        async def embed_worker() -> None:
+            while True:
+                chunk = await embed_queue.get()
+                if chunk is None:
+                    return
+                texts = [msg.message for _, _, msg in chunk]
+                records = []
+                try:
+                    embed_results = await loop.run_in_executor(
+                        None, self._embedder.embed_batch, texts
+                    )
+                    if len(embed_results) != len(chunk):
+                        raise ValueError(
+                            f"embed_batch returned {len(embed_results)} results "
+                            f"for {len(chunk)} texts"
+                        )
+                    for (index, data, embedding_msg), result in zip(chunk, embed_results):
+                        inserted_data = embedding_msg.context_data
+                        if self._apply_embed_result(inserted_data, result, data):
+                            records.append((index, inserted_data, data))
+                        else:
+                            # Already reported by _apply_embed_result
+                            outstanding.pop(index, None)
+                except Exception as e:
+                    logger.error(f"Error generating embeddings for batch: {e}")
+                    fail([index for index, _, _ in chunk], str(e))
+                    continue
+                if records:
+                    await upsert_queue.put(records)
+
+        async def embed_stage() -> None:
+            await asyncio.gather(*(embed_worker() for _ in range(self._embed_workers)))
+            await upsert_queue.put(None)
+
+        async def write(records: List[Tuple[int, Dict[str, Any], Dict[str, Any]]]) -> None:
+            await self._write_records(records, results)
+            for index, _, _ in records:
+                outstanding.pop(index, None)
+
+        async def upsert_stage() -> None:
+            records: List[Tuple[int, Dict[str, Any], Dict[str, Any]]] = []
+            while True:
+                chunk = await upsert_queue.get()
+                if chunk is None:
+                    if records:
+                        await write(records)
+                    return
+                records.extend(chunk)
+                # Flush only full batches, the remainder waits for more chunks or the sentinel
+                while len(records) >= self._upsert_batch_size:
+                    await write(records[: self._upsert_batch_size])
+                    records = records[self._upsert_batch_size :]
+
+        stages = [asyncio.ensure_future(stage()) for stage in (feed, embed_stage, upsert_stage)]
+        try:
+            await asyncio.gather(*stages)
+        except Exception as e:
+            logger.error(f"Embedding pipeline failed: {e}")
+        finally:
+            # A failed or cancelled stage must not leave the others blocked on their queues
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            fail(list(outstanding), "Embedding pipeline aborted before message was processed")
+        return results
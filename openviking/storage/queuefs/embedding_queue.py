@@ -1,6 +1,6 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: Apache-2.0
-from typing import Optional
+from typing import List, Optional
 
 from openviking.utils.logger import get_logger
 
@@ -16,6 +16,11 @@ class EmbeddingQueue(NamedQueue):
     Supports direct enqueue and dequeue of EmbeddingMsg objects.
     """
 
+    # Workers pull several embed chunks (embedding.batch_size, 32 by default) per batch
+    # so the handler's embed and upsert stages overlap within a batch
+    dequeue_batch_size = 128
+    dequeue_batch_wait_ms = 50
+
     async def enqueue(self, msg: Optional[EmbeddingMsg]) -> str:
         """Serialize EmbeddingMsg object and store in queue."""
         if msg is None:
@@ -23,6 +28,10 @@ class EmbeddingQueue(NamedQueue):
             return ""
         return await super().enqueue(msg.to_dict())
 
+    async def enqueue_many(self, msgs: List[Optional[EmbeddingMsg]]) -> List[str]:
+        """Serialize and store multiple EmbeddingMsg objects, None entries are skipped."""
+        return await super().enqueue_many([msg.to_dict() for msg in msgs if msg is not None])
+
     async def dequeue(self) -> Optional[EmbeddingMsg]:
         """Get message from queue and deserialize to EmbeddingMsg object."""
         data_dict = await super().dequeue()
@@ -1,8 +1,10 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: Apache-2.0
 import abc
+import asyncio
 import json
 import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
@@ -88,12 +90,23 @@ class DequeueHandlerBase(abc.ABC):
             return None
         return data
 
+    async def on_dequeue_batch(
+        self, data_list: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Called with a batch of dequeued messages. Defaults to on_dequeue per message."""
+        return [await self.on_dequeue(data) for data in data_list]
+
 
 class NamedQueue:
     """NamedQueue: Operation class for specific named queue, supports status tracking."""
 
     MAX_ERRORS = 100
 
+    # Batch dequeue settings used by queue workers, 1 means one message at a time
+    dequeue_batch_size = 1
+    dequeue_batch_wait_ms = 0
+    _batch_poll_interval = 0.01
+
     def __init__(
         self,
         agfs: "AGFSClient",
@@ -111,6 +124,7 @@ class NamedQueue:
 
         # Status tracking
         self._lock = threading.Lock()
+        self._enqueued = 0
         self._in_progress = 0
         self._processed = 0
         self._error_count = 0
@@ -123,6 +137,11 @@ class NamedQueue:
                 on_error=self._on_process_error,
             )
 
+    def _on_enqueued(self, count: int = 1) -> None:
+        """Called after messages are written to the queue."""
+        with self._lock:
+            self._enqueued += count
+
     def _on_dequeue_start(self) -> None:
         """Called on dequeue."""
         with self._lock:
@@ -161,9 +180,25 @@ class NamedQueue:
                 errors=list(self._errors),
             )
 
+    @property
+    def in_flight(self) -> int:
+        """Messages dequeued but not yet reported as processed or failed."""
+        return self._in_progress
+
+    @property
+    def enqueued_total(self) -> int:
+        """Messages enqueued through this instance since creation or last reset."""
+        return self._enqueued
+
+    @property
+    def processed_total(self) -> int:
+        """Messages processed successfully since creation or last reset."""
+        return self._processed
+
     def reset_status(self) -> None:
         """Reset status counters."""
         with self._lock:
+            self._enqueued = 0
             self._in_progress = 0
             self._processed = 0
             self._error_count = 0
@@ -196,34 +231,61 @@ class NamedQueue:
             data = json.dumps(data)
 
         msg_id = self._agfs.write(enqueue_file, data.encode("utf-8"))
+        self._on_enqueued()
         return msg_id if isinstance(msg_id, str) else str(msg_id)
 
-    async def dequeue(self) -> Optional[Dict[str, Any]]:
-        """Get and remove message from queue (dequeue)."""
+    async def enqueue_many(self, items: List[Union[str, Dict[str, Any]]]) -> List[str]:
+        """Send multiple messages to queue, returns message ids in order."""
+        # QueueFS has no batch write, so messages are still written one by one,
+        # but initialization and hook lookup are done once for the whole batch.
         await self._ensure_initialized()
-        dequeue_file = f"{self.path}/dequeue"
+        enqueue_file = f"{self.path}/enqueue"
 
+        msg_ids = []
         try:
-            content = self._agfs.read(dequeue_file)
-            if not content or content == b"{}":
-                return None
+            for data in items:
+                if self._enqueue_hook:
+                    data = await self._enqueue_hook.on_enqueue(data)
+                if isinstance(data, dict):
+                    data = json.dumps(data)
+                msg_id = self._agfs.write(enqueue_file, data.encode("utf-8"))
+                msg_ids.append(msg_id if isinstance(msg_id, str) else str(msg_id))
+        finally:
+            # Count messages already written even if a later write fails
+            self._on_enqueued(len(msg_ids))
+        return msg_ids
+
+    def _read_message(self) -> Optional[Dict[str, Any]]:
+        """Read and remove the head message from AGFS, without invoking the handler."""
+        content = self._agfs.read(f"{self.path}/dequeue")
+        if not content or content == b"{}":
+            return None
 
-            # Handle different return types from AGFSClient
-            content_bytes = None
-            if isinstance(content, bytes):
-                content_bytes = content
-            elif isinstance(content, str):
-                content_bytes = content.encode("utf-8")
-            elif hasattr(content, "content"):  # Response object
-                content_obj = content.content
-                if content_obj is not None:
-                    content_bytes = content_obj
-            else:
-                content_bytes = str(content).encode("utf-8")
+        # Handle different return types from AGFSClient
+        content_bytes = None
+        if isinstance(content, bytes):
+            content_bytes = content
+        elif isinstance(content, str):
+            content_bytes = content.encode("utf-8")
+        elif hasattr(content, "content"):  # Response object
+            content_obj = content.content
+            if content_obj is not None:
+                content_bytes = content_obj
+        else:
+            content_bytes = str(content).encode("utf-8")
+
+        if content_bytes is None:
+            return None
+        return json.loads(content_bytes.decode("utf-8"))
 
-            if content_bytes is None:
+    async def dequeue(self) -> Optional[Dict[str, Any]]:
+        """Get and remove message from queue (dequeue)."""
+        await self._ensure_initialized()
+
+        try:
+            data = self._read_message()
+            if data is None:
                 return None
-            data = json.loads(content_bytes.decode("utf-8"))
 
             # Dequeue success, mark in_progress
             if self._dequeue_handler:
@@ -235,6 +297,43 @@ class NamedQueue:
             logger.debug(f"[NamedQueue] Dequeue failed for {self.name}: {e}")
             return None
 
+    async def dequeue_batch(
+        self, max_n: int = 1, max_wait_ms: int = 0
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Dequeue up to max_n messages, waiting at most max_wait_ms for the batch to fill.
+
+        The whole batch is handed to the dequeue handler in a single on_dequeue_batch call.
+        """
+        await self._ensure_initialized()
+        deadline = time.monotonic() + max_wait_ms / 1000
+        batch: List[Dict[str, Any]] = []
+
+        try:
+            while len(batch) < max_n:
+                data = self._read_message()
+                if data is not None:
+                    # Off AGFS from here on, count it in_progress so status never looks complete
+                    if self._dequeue_handler:
+                        self._on_dequeue_start()
+                    batch.append(data)
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(min(self._batch_poll_interval, remaining))
+        except Exception as e:
+            logger.debug(f"[NamedQueue] Batch dequeue failed for {self.name}: {e}")
+
+        if not batch or not self._dequeue_handler:
+            return batch
+
+        try:
+            results = await self._dequeue_handler.on_dequeue_batch(batch)
+            return [result for result in results if result is not None]
+        except Exception as e:
+            logger.debug(f"[NamedQueue] Batch dequeue handler failed for {self.name}: {e}")
+            return []
+
     async def peek(self) -> Optional[Dict[str, Any]]:
         """Peek at head message without removing."""
         await self._ensure_initialized()
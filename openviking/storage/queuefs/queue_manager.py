@@ -11,8 +11,7 @@ import threading
 import time
 from typing import Any, Dict, Optional, Union
 
-from pyagfs import AGFSClient
-
+from openviking.utils.agfs_utils import require_agfs
 from openviking.utils.logger import get_logger
 
 from .embedding_queue import EmbeddingQueue
@@ -32,6 +31,7 @@ def init_queue_manager(
 ) -> "QueueManager":
     """Initialize QueueManager singleton."""
     global _instance
+    require_agfs()
     _instance = QueueManager(
         agfs_url=agfs_url,
         timeout=timeout,
@@ -85,6 +85,7 @@ class QueueManager:
         if self._started:
             return
 
+        AGFSClient = require_agfs()
         self._agfs = AGFSClient(api_base_url=self._agfs_url, timeout=self.timeout)
         self._started = True
 
@@ -112,7 +113,7 @@ class QueueManager:
         thread.start()
 
     def _queue_worker_loop(self, queue: NamedQueue, stop_event: threading.Event) -> None:
-        """Worker loop for a single queue, processes items sequentially."""
+        """Worker loop for a single queue, processes items in batches of queue.dequeue_batch_size."""
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
@@ -120,10 +121,15 @@ class QueueManager:
                 try:
                     queue_size = loop.run_until_complete(queue.size())
                     if queue.has_dequeue_handler() and queue_size > 0:
-                        data = loop.run_until_complete(queue.dequeue())
-                        if data is not None:
+                        batch = loop.run_until_complete(
+                            queue.dequeue_batch(
+                                max_n=queue.dequeue_batch_size,
+                                max_wait_ms=queue.dequeue_batch_wait_ms,
+                            )
+                        )
+                        if batch:
                             logger.debug(
-                                f"[QueueManager] Dequeued message from {queue.name}: {data}"
+                                f"[QueueManager] Dequeued {len(batch)} message(s) from {queue.name}"
                             )
                     else:
                         stop_event.wait(self._poll_interval)
@@ -136,8 +142,13 @@ class QueueManager:
         finally:
             loop.close()
 
-    def stop(self) -> None:
-        """Stop QueueManager and release resources."""
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop QueueManager and release resources.
+
+        Args:
+            timeout: Maximum total seconds to wait for workers to finish their current batch,
+                None waits indefinitely. Workers still busy afterwards are abandoned (daemon).
+        """
         global _instance
         if not self._started:
             return
@@ -145,8 +156,11 @@ class QueueManager:
         # Stop queue workers
         for stop_event in self._queue_stop_events.values():
             stop_event.set()
-        for thread in self._queue_threads.values():
-            thread.join()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for name, thread in self._queue_threads.items():
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                logger.warning(f"[QueueManager] Worker for {name} still busy, abandoning it")
         self._queue_threads.clear()
         self._queue_stop_events.clear()
 
@@ -264,6 +278,17 @@ class QueueManager:
         while True:
             if await self.is_all_complete(queue_name):
                 return await self.check_status(queue_name)
-            if timeout and (time.time() - start) > timeout:
+            if timeout is not None and (time.time() - start) >= timeout:
                 raise TimeoutError(f"Queue processing not complete after {timeout}s")
             await asyncio.sleep(poll_interval)
+
+    async def drain(self, timeout: Optional[float] = None, poll_interval: float = 0.1) -> None:
+        """Wait until every queue has no pending or in-progress messages.
+
+        Raises:
+            TimeoutError: If queues are not drained within timeout seconds
+        """
+        if not self._started:
+            return
+        await self.wait_complete(timeout=timeout, poll_interval=poll_interval)
+        logger.info("[QueueManager] All queues drained")
@@ -344,15 +344,13 @@ class VikingVectorIndexBackend(VikingDBInterface):
     # CRUD Operations - Single Record
     # =========================================================================
 
-    async def insert(self, collection: str, data: Dict[str, Any]) -> str:
-        """Insert a single record."""
-        coll = self._get_collection(collection)
-
+    def _prepare_insert_record(
+        self, collection: str, coll: Collection, data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Assign an ID and keep only schema fields, returns None if the record is invalid."""
         # Ensure ID exists
-        record_id = data.get("id")
-        if not record_id:
-            record_id = str(uuid.uuid4())
-            data = {**data, "id": record_id}
+        if not data.get("id"):
+            data = {**data, "id": str(uuid.uuid4())}
 
         # Validate context_type for context collection
         if collection == "context":
@@ -362,18 +360,23 @@ class VikingVectorIndexBackend(VikingDBInterface):
                     f"Invalid context_type: {context_type}. "
                     f"Must be one of ['resource', 'skill', 'memory'], Ignore"
                 )
-                return ""
+                return None
 
         fields = self._get_meta_data(collection, coll).get("Fields", [])
         fields_dict = {item["FieldName"]: item for item in fields}
-        new_data = {}
-        for k in data:
-            if k in fields_dict and data[k] is not None:
-                new_data[k] = data[k]
+        return {k: v for k, v in data.items() if k in fields_dict and v is not None}
+
+    async def insert(self, collection: str, data: Dict[str, Any]) -> str:
+        """Insert a single record."""
+        coll = self._get_collection(collection)
+
+        new_data = self._prepare_insert_record(collection, coll, data)
+        if new_data is None:
+            return ""
 
         try:
             coll.upsert_data([new_data])
-            return record_id
+            return new_data["id"]
         except Exception as e:
             logger.error(f"Error inserting record: {e}")
             raise
@@ -492,23 +495,23 @@ class VikingVectorIndexBackend(VikingDBInterface):
     # =========================================================================
 
     async def batch_insert(self, collection: str, data: List[Dict[str, Any]]) -> List[str]:
-        """Batch insert multiple records."""
+        """Batch insert multiple records, invalid records are skipped with an empty ID."""
         coll = self._get_collection(collection)
 
-        # Ensure all records have IDs
+        # Same per-record preparation as insert, written in a single upsert
         ids = []
-        records_with_ids = []
+        records = []
         for record in data:
-            if "id" not in record:
-                record_id = str(uuid.uuid4())
-                records_with_ids.append({**record, "id": record_id})
-                ids.append(record_id)
-            else:
-                records_with_ids.append(record)
-                ids.append(record["id"])
+            new_data = self._prepare_insert_record(collection, coll, record)
+            if new_data is None:
+                ids.append("")
+                continue
+            records.append(new_data)
+            ids.append(new_data["id"])
 
         try:
-            coll.upsert_data(records_with_ids)
+            if records:
+                coll.upsert_data(records)
             return ids
         except Exception as e:
             logger.error(f"Error batch inserting records: {e}")
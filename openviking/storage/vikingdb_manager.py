@@ -4,20 +4,75 @@
 VikingDB Manager class that extends VikingVectorIndexBackend with queue management functionality.
 """
 
-from typing import Optional
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from openviking.storage.collection_schemas import TextEmbeddingHandler
-from openviking.storage.queuefs.embedding_msg import EmbeddingMsg
-from openviking.storage.queuefs.embedding_queue import EmbeddingQueue
-from openviking.storage.queuefs.queue_manager import init_queue_manager
 from openviking.storage.viking_vector_index_backend import VikingVectorIndexBackend
 from openviking.utils import get_logger
+from openviking.utils.agfs_utils import require_agfs
+from openviking.utils.async_utils import _get_loop, schedule_async
+from openviking.utils.config import get_openviking_config
 from openviking.utils.config.agfs_config import AGFSConfig
 from openviking.utils.config.vectordb_config import VectorDBBackendConfig
 
+if TYPE_CHECKING:
+    from openviking.storage.queuefs.embedding_msg import EmbeddingMsg
+    from openviking.storage.queuefs.embedding_queue import EmbeddingQueue
+
 logger = get_logger(__name__)
 
 
+def _register_queue_gauges() -> Optional[Dict[str, Any]]:
+    """Create the queue gauges, None without prometheus_client or if already registered."""
+    try:
+        from prometheus_client import Gauge
+    except ImportError:
+        return None
+    try:
+        return {
+            "size": Gauge("openviking_queue_size", "Messages waiting in queue", ["queue"]),
+            "in_flight": Gauge("openviking_queue_in_flight", "Messages being processed", ["queue"]),
+            "enqueued": Gauge("openviking_queue_enqueued", "Messages enqueued", ["queue"]),
+            "processed": Gauge("openviking_queue_processed", "Messages processed", ["queue"]),
+        }
+    except ValueError as e:
+        # Duplicate registration, e.g. the module was imported a second time
+        logger.warning("Queue gauges already registered, not exporting them: %s", e)
+        return None
+
+
+_QUEUE_GAUGES = _register_queue_gauges()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_embedder_cached():
+    """Build the configured embedder once, failures are not cached."""
+    return get_openviking_config().embedding.get_embedder()
+
+
+def invalidate_embedder_cache() -> None:
+    """Drop the cached embedder so the next get_embedder() call reads the current config."""
+    _get_embedder_cached.cache_clear()
+
+
+class _NoOpQueue:
+    """Stand-in for the embedding queue when AGFS is not configured, drops every message."""
+
+    async def enqueue(self, msg: "EmbeddingMsg") -> bool:
+        return False
+
+    async def enqueue_many(self, msgs: List[Optional["EmbeddingMsg"]]) -> List[str]:
+        return []
+
+    async def size(self) -> int:
+        return 0
+
+
 class VikingDBManager(VikingVectorIndexBackend):
     """
     VikingDB Manager that extends VikingVectorIndexBackend with queue management capabilities.
@@ -27,14 +82,34 @@ class VikingDBManager(VikingVectorIndexBackend):
     - Embedding queue integration
     - Background processing capabilities
 
+    Queue handlers (and the embedder they load) are set up on first queue use.
+    Call ``await manager.warmup()`` at process start to pay that cost, along with
+    the background loop start and the first embedding round trip, ahead of the
+    first request.
+
     Usage:
         # In-memory mode with queue management
         manager = VikingDBManager()
 
         # Local persistent storage with queue management
         manager = VikingDBManager(path="./data/vikingdb", agfs_url="http://localhost:8080")
+
+        # Recommended: async context manager drains queues and closes on exit
+        async with VikingDBManager(vectordb_config=..., agfs_config=...) as manager:
+            ...
+
+        # Stop immediately without draining
+        await manager.close(graceful=False)
+
+        # Per-queue depth and throughput counters
+        stats = await manager.queue_stats()
     """
 
+    # Log queue stats every QUEUE_HEARTBEAT_INTERVAL seconds while any queue
+    # holds more than QUEUE_HEARTBEAT_DEPTH messages
+    QUEUE_HEARTBEAT_INTERVAL = 30.0
+    QUEUE_HEARTBEAT_DEPTH = 1000
+
     def __init__(
         self,
         vectordb_config: VectorDBBackendConfig,
@@ -58,48 +133,92 @@ class VikingDBManager(VikingVectorIndexBackend):
         self._queue_manager = None
         self._embedding_handler = None
         self._semantic_processor = None
+        self._embedding_queue_cached: Optional[Union["EmbeddingQueue", _NoOpQueue]] = None
+        # Bound enqueue of the cached queue, resolves the queue on first call until then
+        self._enqueue_embedding = self._enqueue_embedding_lazy
         self._closing = False
+        self._queues_initialized = False
+        self._queues_lock = threading.Lock()
+        self._heartbeat: Optional[concurrent.futures.Future] = None
 
-        # Initialize queue manager if AGFS URL is provided
+        # Initialize queue manager if AGFS URL is provided, queues are set up lazily
         self._init_queue_manager()
-        if self._queue_manager:
-            self._init_embedding_queue()
-            self._init_semantic_queue()
-            self._queue_manager.start()
 
     def _init_queue_manager(self):
         """Initialize queue manager for background processing."""
         if not self.agfs_url:
-            logger.warning("AGFS URL not configured, skipping queue manager initialization")
+            logger.warning("AGFS URL not configured, queued embedding is disabled")
+            self._set_embedding_queue(_NoOpQueue())
             return
+        require_agfs()
+        from openviking.storage.queuefs.queue_manager import init_queue_manager
+
         self._queue_manager = init_queue_manager(
             agfs_url=self.agfs_url,
             timeout=self.agfs_timeout,
         )
 
+    def _ensure_queues(self) -> None:
+        """Register queue handlers and start the queue manager on first use."""
+        if self._queues_initialized or not self._queue_manager:
+            return
+        with self._queues_lock:
+            if self._queues_initialized:
+                return
+            self._init_embedding_queue()
+            self._init_semantic_queue()
+            self._queue_manager.start()
+            self._queues_initialized = True
+            self._heartbeat = schedule_async(self._queue_heartbeat(), loop=_get_loop())
+
+    async def warmup(self) -> None:
+        """
+        Pay cold-start costs ahead of the first request.
+
+        Starts the background loop, registers queue handlers (AGFS queue metadata
+        only, no messages are read), builds the embedder and sends it a one-token
+        embed. Embedder failures are logged and do not fail warmup.
+        """
+        _get_loop()
+        self._ensure_queues()
+
+        embedder = self.get_embedder()
+        if embedder is None:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, embedder.embed, "warmup")
+        except Exception as e:
+            logger.warning("Embedder warmup failed: %s", e)
+
     def _init_embedding_queue(self):
         """Initialize embedding queue with TextEmbeddingHandler."""
-        if not self._queue_manager:
-            logger.warning("Queue manager not initialized, skipping embedding queue setup")
-            return
+        from openviking.storage.collection_schemas import TextEmbeddingHandler
 
         # Create TextEmbeddingHandler instance with self (VikingDBInterface)
         self._embedding_handler = TextEmbeddingHandler(self)
 
         # Get embedding queue with the handler, allow creation if not exists
-        self._queue_manager.get_queue(
-            self._queue_manager.EMBEDDING,
-            dequeue_handler=self._embedding_handler,
-            allow_create=True,
+        self._set_embedding_queue(
+            self._queue_manager.get_queue(
+                self._queue_manager.EMBEDDING,
+                dequeue_handler=self._embedding_handler,
+                allow_create=True,
+            )
         )
         logger.info("Embedding queue initialized with TextEmbeddingHandler")
 
+    def _set_embedding_queue(self, queue: Union["EmbeddingQueue", _NoOpQueue]) -> None:
+        """Cache the embedding queue and bind its enqueue for the fast path."""
+        self._embedding_queue_cached = queue
+        self._enqueue_embedding = queue.enqueue
+
+    async def _enqueue_embedding_lazy(self, embedding_msg: "EmbeddingMsg"):
+        """First enqueue before queues are set up, rebinds _enqueue_embedding on the way."""
+        self._ensure_queues()
+        return await self._embedding_queue_cached.enqueue(embedding_msg)
+
     def _init_semantic_queue(self):
         """Initialize semantic queue with SemanticProcessor, semantic queue is used to get abstract and summary of context data."""
-        if not self._queue_manager:
-            logger.warning("Queue manager not initialized, skipping semantic queue setup")
-            return
-
         from openviking.storage.queuefs import SemanticProcessor
 
         # Create SemanticProcessor instance
@@ -113,21 +232,53 @@ class VikingDBManager(VikingVectorIndexBackend):
         )
         logger.info("Semantic queue initialized with SemanticProcessor")
 
-    async def close(self) -> None:
-        """Close storage connection and release resources, including queue manager."""
+    async def close(self, graceful: bool = True, timeout: float = 30.0) -> None:
+        """
+        Close storage connection and release resources, including queue manager.
+
+        Args:
+            graceful: Wait for queued and in-flight messages before stopping the queue manager
+            timeout: Maximum seconds to wait for draining and for workers to finish their
+                current batch, busy workers are abandoned after that
+        """
+        deadline = time.monotonic() + timeout
+        # New enqueues are rejected from here on
         self._closing = True
+        if self._heartbeat:
+            self._heartbeat.cancel()
+            self._heartbeat = None
         try:
-            # Close should stop queue processing immediately.
             if self._queue_manager:
-                self._queue_manager.stop()
+                if graceful and self._queues_initialized:
+                    try:
+                        await self._queue_manager.drain(timeout=timeout)
+                    except TimeoutError:
+                        logger.warning(
+                            "Queues not drained after %ss, stopping queue manager immediately",
+                            timeout,
+                        )
+                # Joining workers blocks, keep it off the event loop
+                await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    functools.partial(
+                        self._queue_manager.stop, timeout=max(0.0, deadline - time.monotonic())
+                    ),
+                )
                 self._queue_manager = None
+                self._set_embedding_queue(_NoOpQueue())
                 logger.info("Queue manager stopped")
 
             # Then close the base backend
             await super().close()
 
         except Exception as e:
-            logger.error(f"Error closing VikingDB manager: {e}")
+            logger.error("Error closing VikingDB manager: %s", e)
+
+    async def __aenter__(self) -> "VikingDBManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close(graceful=True)
 
     @property
     def is_closing(self) -> bool:
@@ -144,13 +295,10 @@ class VikingDBManager(VikingVectorIndexBackend):
         return self._queue_manager
 
     @property
-    def embedding_queue(self) -> Optional["EmbeddingQueue"]:
-        """Get the embedding queue instance."""
-        if not self._queue_manager:
-            return None
-        # get_queue returns EmbeddingQueue when name is QueueManager.EMBEDDING
-        queue = self._queue_manager.get_queue(self._queue_manager.EMBEDDING)
-        return queue if isinstance(queue, EmbeddingQueue) else None
+    def embedding_queue(self) -> Union["EmbeddingQueue", _NoOpQueue]:
+        """Get the embedding queue instance, a no-op stub when AGFS is not configured."""
+        self._ensure_queues()
+        return self._embedding_queue_cached
 
     @property
     def has_queue_manager(self) -> bool:
@@ -169,25 +317,38 @@ class VikingDBManager(VikingVectorIndexBackend):
             embedding_msg: The EmbeddingMsg object to enqueue
 
         Returns:
-            True if enqueued successfully, False otherwise
+            True if enqueued, False if the message is None, the manager is closing
+            or AGFS is not configured
+
+        Raises:
+            Exception: Errors from the underlying queue are propagated to the caller
         """
-        if not embedding_msg:
-            logger.warning("Embedding message is None, skipping enqueuing")
+        if self._closing or embedding_msg is None:
             return False
+        return bool(await self._enqueue_embedding(embedding_msg))
 
-        if not self._queue_manager:
-            raise RuntimeError("Queue manager not initialized, cannot enqueue embedding")
+    async def enqueue_embedding_msgs(self, embedding_msgs: List["EmbeddingMsg"]) -> int:
+        """
+        Enqueue a batch of embedding messages in a single call.
+
+        Args:
+            embedding_msgs: The EmbeddingMsg objects to enqueue, None entries are skipped
 
+        Returns:
+            Number of messages enqueued
+        """
+        if self._closing:
+            logger.warning("VikingDB manager is closing, rejecting embedding messages")
+            return 0
+
+        self._ensure_queues()
         try:
-            embedding_queue = self.embedding_queue
-            if not embedding_queue:
-                raise RuntimeError("Embedding queue not initialized")
-            await embedding_queue.enqueue(embedding_msg)
-            logger.debug(f"Enqueued embedding message: {embedding_msg.id}")
-            return True
+            msg_ids = await self._embedding_queue_cached.enqueue_many(embedding_msgs)
+            logger.debug("Enqueued %d embedding messages", len(msg_ids))
+            return len(msg_ids)
         except Exception as e:
-            logger.error(f"Error enqueuing embedding message: {e}")
-            return False
+            logger.error("Error enqueuing embedding messages: %s", e)
+            return 0
 
     async def get_embedding_queue_size(self) -> int:
         """
@@ -196,16 +357,59 @@ class VikingDBManager(VikingVectorIndexBackend):
         Returns:
             The number of messages in the embedding queue
         """
-        if not self._queue_manager:
-            return 0
-
+        self._ensure_queues()
         try:
-            embedding_queue = self._queue_manager.get_queue("embedding")
-            return await embedding_queue.size()
+            return await self._embedding_queue_cached.size()
         except Exception as e:
-            logger.error(f"Error getting embedding queue size: {e}")
+            logger.error("Error getting embedding queue size: %s", e)
             return 0
 
+    async def queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get depth and throughput counters for the embedding and semantic queues.
+
+        Returns:
+            Dict keyed by queue ("embedding", "semantic") with size, in_flight,
+            enqueued and processed counts, empty if queues are not initialized
+        """
+        if not self._queue_manager or not self._queues_initialized:
+            return {}
+
+        stats = {}
+        for key, name in (
+            ("embedding", self._queue_manager.EMBEDDING),
+            ("semantic", self._queue_manager.SEMANTIC),
+        ):
+            queue = self._queue_manager.get_queue(name)
+            stats[key] = {
+                "size": await queue.size(),
+                "in_flight": queue.in_flight,
+                "enqueued": queue.enqueued_total,
+                "processed": queue.processed_total,
+            }
+            if _QUEUE_GAUGES:
+                for metric, gauge in _QUEUE_GAUGES.items():
+                    gauge.labels(queue=key).set(stats[key][metric])
+        return stats
+
+    async def _queue_heartbeat(self) -> None:
+        """Periodically log queue stats while queues are backed up."""
+        while not self._closing:
+            await asyncio.sleep(self.QUEUE_HEARTBEAT_INTERVAL)
+            # Collecting stats costs one AGFS read per queue, skip it when nobody consumes them
+            if not _QUEUE_GAUGES and not logger.isEnabledFor(logging.INFO):
+                continue
+            try:
+                # size() reads AGFS synchronously, keep it off the shared loop
+                stats = await asyncio.get_running_loop().run_in_executor(
+                    None, asyncio.run, self.queue_stats()
+                )
+            except Exception as e:
+                logger.debug("Failed to collect queue stats: %s", e)
+                continue
+            if any(s["size"] > self.QUEUE_HEARTBEAT_DEPTH for s in stats.values()):
+                logger.info("Queue backlog: %s", stats)
+
     def get_embedder(self):
         """
         Get the embedder instance from configuration.
@@ -214,10 +418,7 @@ class VikingDBManager(VikingVectorIndexBackend):
             Embedder instance or None if not configured
         """
         try:
-            from openviking.utils.config import get_openviking_config
-
-            config = get_openviking_config()
-            return config.embedding.get_embedder()
+            return _get_embedder_cached()
         except Exception as e:
-            logger.warning(f"Failed to get embedder from configuration: {e}")
+            logger.warning("Failed to get embedder from configuration: %s", e)
             return None
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 
 from openviking.async_client import AsyncOpenViking
 from openviking.utils import run_async
+from openviking.utils.async_utils import _get_loop
 
 
 class SyncOpenViking:
@@ -21,11 +22,18 @@ class SyncOpenViking:
 
     def __init__(self, **kwargs):
         self._async_client = AsyncOpenViking(**kwargs)
+        # Async clients are bound to the loop they were created on, so every call from
+        # any thread runs on this one
+        self._loop = _get_loop()
         self._initialized = False
 
+    def _run(self, coro):
+        """Run coroutine on the loop this client is bound to."""
+        return run_async(coro, loop=self._loop)
+
     def initialize(self) -> None:
         """Initialize OpenViking storage and indexes."""
-        run_async(self._async_client.initialize())
+        self._run(self._async_client.initialize())
         self._initialized = True
 
     def session(self, session_id: Optional[str] = None) -> "Session":
@@ -34,27 +42,27 @@ class SyncOpenViking:
 
     def create_session(self) -> Dict[str, Any]:
         """Create a new session."""
-        return run_async(self._async_client.create_session())
+        return self._run(self._async_client.create_session())
 
     def list_sessions(self) -> List[Any]:
         """List all sessions."""
-        return run_async(self._async_client.list_sessions())
+        return self._run(self._async_client.list_sessions())
 
     def get_session(self, session_id: str) -> Dict[str, Any]:
         """Get session details."""
-        return run_async(self._async_client.get_session(session_id))
+        return self._run(self._async_client.get_session(session_id))
 
     def delete_session(self, session_id: str) -> None:
         """Delete a session."""
-        run_async(self._async_client.delete_session(session_id))
+        self._run(self._async_client.delete_session(session_id))
 
     def add_message(self, session_id: str, role: str, content: str) -> Dict[str, Any]:
         """Add a message to a session."""
-        return run_async(self._async_client.add_message(session_id, role, content))
+        return self._run(self._async_client.add_message(session_id, role, content))
 
     def commit_session(self, session_id: str) -> Dict[str, Any]:
         """Commit a session (archive and extract memories)."""
-        return run_async(self._async_client.commit_session(session_id))
+        return self._run(self._async_client.commit_session(session_id))
 
     def add_resource(
         self,
@@ -66,7 +74,7 @@ class SyncOpenViking:
         timeout: float = None,
     ) -> Dict[str, Any]:
         """Add resource to OpenViking (resources scope only)"""
-        return run_async(
+        return self._run(
             self._async_client.add_resource(path, target, reason, instruction, wait, timeout)
         )
 
@@ -77,7 +85,7 @@ class SyncOpenViking:
         timeout: float = None,
     ) -> Dict[str, Any]:
         """Add skill to OpenViking."""
-        return run_async(self._async_client.add_skill(data, wait=wait, timeout=timeout))
+        return self._run(self._async_client.add_skill(data, wait=wait, timeout=timeout))
 
     def search(
         self,
@@ -90,7 +98,7 @@ class SyncOpenViking:
         filter: Optional[Dict] = None,
     ):
         """Execute complex retrieval (intent analysis, hierarchical retrieval)."""
-        return run_async(
+        return self._run(
             self._async_client.search(
                 query, target_uri, session, session_id, limit, score_threshold, filter
             )
@@ -104,19 +112,19 @@ class SyncOpenViking:
         score_threshold: Optional[float] = None,
     ):
         """Quick retrieval"""
-        return run_async(self._async_client.find(query, target_uri, limit, score_threshold))
+        return self._run(self._async_client.find(query, target_uri, limit, score_threshold))
 
     def abstract(self, uri: str) -> str:
         """Read L0 abstract"""
-        return run_async(self._async_client.abstract(uri))
+        return self._run(self._async_client.abstract(uri))
 
     def overview(self, uri: str) -> str:
         """Read L1 overview"""
-        return run_async(self._async_client.overview(uri))
+        return self._run(self._async_client.overview(uri))
 
     def read(self, uri: str) -> str:
         """Read file"""
-        return run_async(self._async_client.read(uri))
+        return self._run(self._async_client.read(uri))
 
     def ls(self, uri: str, **kwargs) -> List[Any]:
         """
@@ -127,65 +135,65 @@ class SyncOpenViking:
             simple: Return only relative path list (bool, default: False)
             recursive: List all subdirectories recursively (bool, default: False)
         """
-        return run_async(self._async_client.ls(uri, **kwargs))
+        return self._run(self._async_client.ls(uri, **kwargs))
 
     def link(self, from_uri: str, uris: Any, reason: str = "") -> None:
         """Create relation"""
-        return run_async(self._async_client.link(from_uri, uris, reason))
+        return self._run(self._async_client.link(from_uri, uris, reason))
 
     def unlink(self, from_uri: str, uri: str) -> None:
         """Delete relation"""
-        return run_async(self._async_client.unlink(from_uri, uri))
+        return self._run(self._async_client.unlink(from_uri, uri))
 
     def export_ovpack(self, uri: str, to: str) -> str:
         """Export .ovpack file"""
-        return run_async(self._async_client.export_ovpack(uri, to))
+        return self._run(self._async_client.export_ovpack(uri, to))
 
     def import_ovpack(
         self, file_path: str, target: str, force: bool = False, vectorize: bool = True
     ) -> str:
         """Import .ovpack file (triggers vectorization by default)"""
-        return run_async(self._async_client.import_ovpack(file_path, target, force, vectorize))
+        return self._run(self._async_client.import_ovpack(file_path, target, force, vectorize))
 
     def close(self) -> None:
         """Close OpenViking and release resources."""
-        return run_async(self._async_client.close())
+        return self._run(self._async_client.close())
 
     def relations(self, uri: str) -> List[Dict[str, Any]]:
         """Get relations"""
-        return run_async(self._async_client.relations(uri))
+        return self._run(self._async_client.relations(uri))
 
     def rm(self, uri: str, recursive: bool = False) -> None:
         """Delete resource"""
-        return run_async(self._async_client.rm(uri, recursive))
+        return self._run(self._async_client.rm(uri, recursive))
 
     def wait_processed(self, timeout: float = None) -> Dict[str, Any]:
         """Wait for all async operations to complete"""
-        return run_async(self._async_client.wait_processed(timeout))
+        return self._run(self._async_client.wait_processed(timeout))
 
     def grep(self, uri: str, pattern: str, case_insensitive: bool = False) -> Dict:
         """Content search"""
-        return run_async(self._async_client.grep(uri, pattern, case_insensitive))
+        return self._run(self._async_client.grep(uri, pattern, case_insensitive))
 
     def glob(self, pattern: str, uri: str = "viking://") -> Dict:
         """File pattern matching"""
-        return run_async(self._async_client.glob(pattern, uri))
+        return self._run(self._async_client.glob(pattern, uri))
 
     def mv(self, from_uri: str, to_uri: str) -> None:
         """Move resource"""
-        return run_async(self._async_client.mv(from_uri, to_uri))
+        return self._run(self._async_client.mv(from_uri, to_uri))
 
     def tree(self, uri: str) -> Dict:
         """Get directory tree"""
-        return run_async(self._async_client.tree(uri))
+        return self._run(self._async_client.tree(uri))
 
     def stat(self, uri: str) -> Dict:
         """Get resource status"""
-        return run_async(self._async_client.stat(uri))
+        return self._run(self._async_client.stat(uri))
 
     def mkdir(self, uri: str) -> None:
         """Create directory"""
-        return run_async(self._async_client.mkdir(uri))
+        return self._run(self._async_client.mkdir(uri))
 
     def get_status(self):
         """Get system status.
@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 """Utility functions and helpers."""
 
-from openviking.utils.async_utils import run_async
+from openviking.utils.async_utils import run_async, schedule_async
 from openviking.utils.llm import StructuredLLM, parse_json_from_response, parse_json_to_model
 from openviking.utils.logger import default_logger, get_logger
 from openviking.utils.uri import VikingURI
@@ -15,4 +15,5 @@ __all__ = [
     "parse_json_from_response",
     "parse_json_to_model",
     "run_async",
+    "schedule_async",
 ]
@@ -0,0 +1,29 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+AGFS SDK helpers.
+
+The AGFS Python SDK (pyagfs) is only needed by components that talk to an AGFS
+server, so it is resolved on first use instead of at package import.
+"""
+
+from typing import TYPE_CHECKING, Type
+
+if TYPE_CHECKING:
+    from pyagfs import AGFSClient
+
+
+def require_agfs() -> Type["AGFSClient"]:
+    """
+    Import and return the AGFSClient class.
+
+    Raises:
+        ImportError: If the pyagfs package is not installed
+    """
+    try:
+        from pyagfs import AGFSClient
+    except ImportError as e:
+        raise ImportError(
+            "pyagfs not found. Please install: pip install -e third_party/agfs/agfs-sdk/python"
+        ) from e
+    return AGFSClient
@@ -2,68 +2,317 @@
 # SPDX-License-Identifier: Apache-2.0
 """
 Async helper utilities for running coroutines from sync code.
+
+Stateful async clients (e.g. httpx.AsyncClient) are bound to the loop they were
+created on. Sync wrappers that own one pick a pooled loop once with _get_loop() and
+pass it to every run_async(coro, loop=...) call, so the client works from any thread.
+Stateless work can omit loop and runs on the loop the calling thread is pinned to.
 """
 
 import asyncio
 import atexit
+import concurrent.futures
+import functools
+import os
 import threading
-from typing import Coroutine, TypeVar
+from collections import deque
+from typing import Coroutine, Deque, List, Optional, Tuple, TypeVar
+
+from openviking.utils.logger import get_logger
 
 T = TypeVar("T")
 
-_lock = threading.Lock()
-_loop: asyncio.AbstractEventLoop = None
-_loop_thread: threading.Thread = None
+logger = get_logger(__name__)
+
+_shutting_down = False
+
+# Opt-in for integrations that need coroutines to run on the caller's own loop
+NEST_ASYNCIO_ENV = "OPENVIKING_NEST_ASYNCIO"
+_nest_asyncio_enabled = os.environ.get(NEST_ASYNCIO_ENV, "").lower() in ("1", "true", "yes")
+
+
+async def _cleanup_loop_internal() -> None:
+    """Cancel remaining tasks and release loop resources, runs inside the loop thread."""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    loop = asyncio.get_running_loop()
+    await loop.shutdown_asyncgens()
+    if hasattr(loop, "shutdown_default_executor"):
+        await loop.shutdown_default_executor()
+
+
+def _teardown_loop(loop: asyncio.AbstractEventLoop, loop_thread: threading.Thread) -> None:
+    """Clean up loop inside its thread, then close it once that thread has exited."""
+    if loop.is_closed():
+        return
+
+    if loop_thread is not None and loop_thread.is_alive():
+        try:
+            asyncio.run_coroutine_threadsafe(_cleanup_loop_internal(), loop).result(timeout=5)
+        except Exception as e:
+            logger.debug(f"Error cleaning up shared event loop: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join(timeout=5)
+
+    if not loop.is_running():
+        loop.close()
+
+
+_Submission = Tuple[Coroutine, concurrent.futures.Future]
+
+
+def _cancel_task_with_future(
+    loop: asyncio.AbstractEventLoop, task: asyncio.Task, future: concurrent.futures.Future
+) -> None:
+    """Cancel the task when the caller cancels its future, runs in the caller's thread."""
+    if not future.cancelled() or loop.is_closed():
+        return
+    try:
+        loop.call_soon_threadsafe(task.cancel)
+    except RuntimeError:
+        # Loop closed in the meantime, its tasks are already gone
+        pass
+
+
+def _copy_task_result(future: concurrent.futures.Future, task: asyncio.Task) -> None:
+    """Propagate a finished task's outcome to the caller's future.
+
+    The future is only marked running here, like asyncio's run_coroutine_threadsafe(),
+    so the caller can still cancel() it while the task runs.
+    """
+    if task.cancelled():
+        future.cancel()
+    if not future.set_running_or_notify_cancel():
+        return
+    exc = task.exception()
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(task.result())
+
+
+class _LoopPool:
+    """Fixed set of event loops, each running forever in its own daemon thread.
+
+    Loops are started on first use. A caller thread always maps to the same loop,
+    so async clients created through run_async() stay valid for that thread.
+    Submissions to a loop are queued in a per-loop deque and handed over in bursts,
+    one cross-thread wakeup per burst rather than per coroutine.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._lock = threading.Lock()
+        self._loops: List[Optional[asyncio.AbstractEventLoop]] = [None] * size
+        self._threads: List[Optional[threading.Thread]] = [None] * size
+        self._pending: List[Deque[_Submission]] = [deque() for _ in range(size)]
+        self._drain_scheduled: List[bool] = [False] * size
+
+    def get(self, index: int) -> asyncio.AbstractEventLoop:
+        """Get or start the loop at index."""
+        loop = self._loops[index]
+        if loop is not None and not loop.is_closed():
+            return loop
+        with self._lock:
+            loop = self._loops[index]
+            if loop is not None and not loop.is_closed():
+                return loop
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name=f"openviking-loop-{index}", daemon=True
+            )
+            thread.start()
+            self._loops[index] = loop
+            self._threads[index] = thread
+        return loop
+
+    def _index_for_current_thread(self) -> int:
+        # Hash a tuple so aligned object addresses still spread across the pool
+        return hash((id(threading.current_thread()),)) % self.size
+
+    def for_current_thread(self) -> asyncio.AbstractEventLoop:
+        """Get the loop the calling thread is pinned to."""
+        return self.get(self._index_for_current_thread())
+
+    def _index_of(self, loop: asyncio.AbstractEventLoop) -> Optional[int]:
+        for index, pooled in enumerate(self._loops):
+            if pooled is loop:
+                return index
+        return None
+
+    def submit(
+        self, coro: Coroutine[None, None, T], loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> concurrent.futures.Future:
+        """Queue coroutine on loop, or the calling thread's loop, waking it at most once per burst."""
+        if loop is None:
+            index = self._index_for_current_thread()
+            loop = self.get(index)
+        else:
+            index = self._index_of(loop)
+            if index is None:
+                return asyncio.run_coroutine_threadsafe(coro, loop)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            self._pending[index].append((coro, future))
+            if self._drain_scheduled[index]:
+                return future
+            self._drain_scheduled[index] = True
+        try:
+            loop.call_soon_threadsafe(self._drain_pending, index)
+        except RuntimeError:
+            # Loop closed underneath us during shutdown
+            self._fail_pending(index)
+        return future
+
+    def _drain_pending(self, index: int) -> None:
+        """Start every queued coroutine as a task, runs inside the loop thread."""
+        with self._lock:
+            submissions = list(self._pending[index])
+            self._pending[index].clear()
+            self._drain_scheduled[index] = False
+        loop = asyncio.get_running_loop()
+        for coro, future in submissions:
+            if future.cancelled():
+                coro.close()
+                continue
+            task = asyncio.ensure_future(coro)
+            task.add_done_callback(functools.partial(_copy_task_result, future))
+            future.add_done_callback(functools.partial(_cancel_task_with_future, loop, task))
+
+    def _fail_pending(self, index: int) -> None:
+        """Reject submissions that will never be drained."""
+        with self._lock:
+            submissions = list(self._pending[index])
+            self._pending[index].clear()
+            self._drain_scheduled[index] = False
+        for coro, future in submissions:
+            coro.close()
+            if future.set_running_or_notify_cancel():
+                future.set_exception(
+                    RuntimeError("Shared event loop closed before running coroutine")
+                )
+
+    def owns_current_thread(self) -> bool:
+        """Whether the calling thread is one of the pool's loop threads."""
+        return threading.current_thread() in self._threads
+
+    def shutdown(self) -> None:
+        """Tear down every started loop."""
+        with self._lock:
+            entries = list(zip(self._loops, self._threads))
+            self._loops = [None] * self.size
+            self._threads = [None] * self.size
+        for index, (loop, loop_thread) in enumerate(entries):
+            if loop is not None:
+                _teardown_loop(loop, loop_thread)
+            self._fail_pending(index)
+
+
+_pool = _LoopPool(min(4, os.cpu_count() or 1))
 
 
 def _get_loop() -> asyncio.AbstractEventLoop:
-    """Get or create a shared event loop running in a background thread."""
-    global _loop, _loop_thread
-    if _loop is not None and not _loop.is_closed():
-        return _loop
-    with _lock:
-        if _loop is not None and not _loop.is_closed():
-            return _loop
-        _loop = asyncio.new_event_loop()
-        _loop_thread = threading.Thread(target=_loop.run_forever, daemon=True)
-        _loop_thread.start()
-        atexit.register(_shutdown_loop)
-    return _loop
+    """Get the background-thread event loop shared by the calling thread."""
+    return _pool.for_current_thread()
 
 
 def _shutdown_loop():
-    """Shutdown the shared loop on process exit."""
-    global _loop, _loop_thread
-    if _loop is not None and not _loop.is_closed():
-        _loop.call_soon_threadsafe(_loop.stop)
-        _loop_thread.join(timeout=5)
-        _loop.close()
-    _loop = None
-    _loop_thread = None
+    """Shutdown all pooled loops on process exit."""
+    global _shutting_down
+    _shutting_down = True
+    _pool.shutdown()
 
 
-def run_async(coro: Coroutine[None, None, T]) -> T:
+atexit.register(_shutdown_loop)
+
+
+def _run_nested(loop: asyncio.AbstractEventLoop, coro: Coroutine[None, None, T]) -> T:
+    """Run coroutine re-entrantly on the caller's loop, only used when NEST_ASYNCIO_ENV is set."""
+    import nest_asyncio
+
+    nest_asyncio.apply(loop)
+    return loop.run_until_complete(coro)
+
+
+def run_async(
+    coro: Coroutine[None, None, T], loop: Optional[asyncio.AbstractEventLoop] = None
+) -> T:
     """
-    Run async coroutine from sync code, handling nested event loops.
+    Run async coroutine from sync code.
+
+    Only for true sync callers; async code should await the coroutine directly
+    or use schedule_async().
 
-    This function safely runs a coroutine whether or not there's already
-    a running event loop (e.g., when called from within an MCP server).
-    When no loop is running, uses a shared background-thread loop so that
-    stateful async objects (e.g. httpx.AsyncClient) stay on the same loop.
+    The coroutine runs on loop if given, otherwise on the background-thread loop the
+    calling thread is pinned to. Objects holding stateful async clients (e.g.
+    httpx.AsyncClient) pass their own loop so they can be used from any thread.
+    Callers that already have a running loop (e.g. an MCP server) block on
+    the result without the loop being patched. Setting OPENVIKING_NEST_ASYNCIO=1
+    restores the nest_asyncio behaviour of running on the caller's loop.
 
     Args:
         coro: The coroutine to run
+        loop: Background loop from _get_loop() to run on
 
     Returns:
         The result of coroutine
+
+    Raises:
+        RuntimeError: If the loop pool is shutting down, or if called from one of
+            the pooled loop threads without OPENVIKING_NEST_ASYNCIO (await the
+            coroutine directly instead)
     """
-    try:
-        loop = asyncio.get_running_loop()
-        import nest_asyncio
+    if _shutting_down:
+        coro.close()
+        raise RuntimeError("Shared event loop is shutting down, cannot run coroutine")
 
-        nest_asyncio.apply()
-        return loop.run_until_complete(coro)
+    try:
+        running_loop = asyncio.get_running_loop()
     except RuntimeError:
-        loop = _get_loop()
-        future = asyncio.run_coroutine_threadsafe(coro, loop)
-        return future.result()
+        running_loop = None
+
+    if running_loop is not None:
+        if _nest_asyncio_enabled:
+            return _run_nested(running_loop, coro)
+        if _pool.owns_current_thread():
+            coro.close()
+            raise RuntimeError(
+                "run_async() called from the shared event loop thread, await the coroutine instead"
+            )
+
+    return _pool.submit(coro, loop).result()
+
+
+def schedule_async(
+    coro: Coroutine[None, None, T], loop: Optional[asyncio.AbstractEventLoop] = None
+) -> concurrent.futures.Future:
+    """
+    Schedule async coroutine without blocking the caller.
+
+    By default the coroutine runs as a task on the caller's running loop, or on the
+    calling thread's pooled loop when there is none. Pass loop=_get_loop() for
+    coroutines that touch state bound to the pooled loop.
+
+    Args:
+        coro: The coroutine to schedule
+        loop: Event loop to run on
+
+    Returns:
+        Future for the coroutine result, awaitable via asyncio.wrap_future()
+    """
+    if loop is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+    if loop is None:
+        if _shutting_down:
+            coro.close()
+            raise RuntimeError("Shared event loop is shutting down, cannot run coroutine")
+        return _pool.submit(coro)
+    return asyncio.run_coroutine_threadsafe(coro, loop)
@@ -257,3 +257,14 @@ class EmbeddingConfig(BaseModel):
         if self.dense:
             return self.dense.dimension or 2048
         return 2048
+
+    @property
+    def batch_size(self) -> int:
+        """Get embedding batch size from active config."""
+        if self.hybrid:
+            return self.hybrid.batch_size
+        if self.dense:
+            return self.dense.batch_size
+        if self.sparse:
+            return self.sparse.batch_size
+        return 32
@@ -208,4 +208,7 @@ class SkillProcessor:
         context.uri = skill_dir_uri
 
         embedding_msg = EmbeddingMsgConverter.from_context(context)
-        await self.vikingdb.enqueue_embedding_msg(embedding_msg)
+        try:
+            await self.vikingdb.enqueue_embedding_msg(embedding_msg)
+        except Exception as e:
+            logger.error(f"Failed to enqueue skill {skill_dir_uri} for vectorization: {e}")
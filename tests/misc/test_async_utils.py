@@ -0,0 +1,188 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for the sync-to-async helpers in openviking.utils.async_utils.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from openviking.utils import async_utils
+from openviking.utils.async_utils import run_async, schedule_async
+
+
+@pytest.fixture
+def fresh_loop(monkeypatch):
+    """Run each test against its own loop pool, restoring module state afterwards."""
+    monkeypatch.setattr(async_utils, "_pool", async_utils._LoopPool(2))
+    monkeypatch.setattr(async_utils, "_shutting_down", False)
+    yield
+    async_utils._shutdown_loop()
+
+
+async def _add(a, b):
+    await asyncio.sleep(0)
+    return a + b
+
+
+def test_run_async_from_sync(fresh_loop):
+    assert run_async(_add(1, 2)) == 3
+
+
+def test_shutdown_cancels_pending_tasks(fresh_loop):
+    loop = async_utils._get_loop()
+    started = asyncio.Event()
+    cancelled = []
+
+    async def sleeper():
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    asyncio.run_coroutine_threadsafe(sleeper(), loop)
+    run_async(started.wait())
+
+    async_utils._shutdown_loop()
+
+    assert cancelled == [True]
+    assert loop.is_closed()
+    assert async_utils._pool._loops == [None, None]
+
+
+def test_run_async_after_shutdown_raises(fresh_loop):
+    async_utils._shutdown_loop()
+
+    coro = _add(1, 2)
+    with pytest.raises(RuntimeError, match="shutting down"):
+        run_async(coro)
+    # The rejected coroutine is closed rather than left un-awaited
+    assert coro.cr_frame is None
+
+
+async def test_run_async_inside_running_loop_uses_shared_loop(fresh_loop):
+    """Called from a coroutine, run_async hops to the background loop instead of nesting."""
+
+    async def current_thread():
+        return threading.current_thread()
+
+    assert run_async(current_thread()) in async_utils._pool._threads
+    assert not hasattr(asyncio.get_running_loop(), "_nest_patched")
+
+
+def test_run_async_from_shared_loop_thread_raises(fresh_loop):
+    async def nested():
+        return run_async(_add(1, 2))
+
+    with pytest.raises(RuntimeError, match="await the coroutine"):
+        run_async(nested())
+
+
+def test_nest_asyncio_opt_in_applies_on_shared_loop_thread(fresh_loop, monkeypatch):
+    nested_loops = []
+
+    def run_nested(loop, coro):
+        nested_loops.append(loop)
+        coro.close()
+        return 3
+
+    monkeypatch.setattr(async_utils, "_nest_asyncio_enabled", True)
+    monkeypatch.setattr(async_utils, "_run_nested", run_nested)
+
+    async def nested():
+        return run_async(_add(1, 2))
+
+    assert run_async(nested()) == 3
+    assert nested_loops == [async_utils._get_loop()]
+
+
+async def test_schedule_async_runs_on_caller_loop(fresh_loop):
+    future = schedule_async(_add(2, 3))
+
+    assert await asyncio.wrap_future(future) == 5
+    assert async_utils._pool._loops == [None, None]
+
+
+async def test_schedule_async_on_shared_loop(fresh_loop):
+    async def current_thread():
+        return threading.current_thread()
+
+    future = schedule_async(current_thread(), loop=async_utils._get_loop())
+
+    assert await asyncio.wrap_future(future) in async_utils._pool._threads
+
+
+def test_schedule_async_from_sync_code_uses_shared_loop(fresh_loop):
+    assert schedule_async(_add(1, 1)).result(timeout=5) == 2
+    assert async_utils._get_loop() in async_utils._pool._loops
+
+
+async def _running_loop():
+    return asyncio.get_running_loop()
+
+
+def test_caller_thread_is_pinned_to_one_loop(fresh_loop):
+    assert run_async(_running_loop()) is run_async(_running_loop())
+
+
+def test_shutdown_closes_every_pooled_loop(fresh_loop):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        loops = set(executor.map(lambda _: run_async(_running_loop()), range(32)))
+
+    async_utils._shutdown_loop()
+
+    assert loops
+    assert all(loop.is_closed() for loop in loops)
+
+
+def test_burst_of_submissions_shares_one_wakeup(fresh_loop):
+    pool = async_utils._pool
+    loop = pool.for_current_thread()
+    gate = threading.Event()
+    # Block the loop so the whole burst lands in one drain
+    loop.call_soon_threadsafe(gate.wait)
+
+    futures = [pool.submit(_add(i, 1)) for i in range(20)]
+    scheduled = list(pool._drain_scheduled)
+    gate.set()
+
+    assert [future.result(timeout=5) for future in futures] == list(range(1, 21))
+    assert scheduled.count(True) == 1
+    assert not any(pool._pending)
+
+
+def test_submission_exception_reaches_caller(fresh_loop):
+    async def boom():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_async(boom())
+
+
+def test_cancelling_submission_cancels_running_task(fresh_loop):
+    started = threading.Event()
+    outcome = []
+
+    async def work():
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            outcome.append("cancelled")
+            raise
+        outcome.append("finished")
+
+    future = schedule_async(work())
+    assert started.wait(timeout=5)
+
+    assert future.cancel() is True
+
+    # The cancellation reaches the task on the pooled loop
+    run_async(asyncio.sleep(0.05))
+    assert outcome == ["cancelled"]
+    assert future.cancelled()
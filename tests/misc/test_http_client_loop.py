@@ -0,0 +1,118 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests that the HTTP clients keep their connections on the event loop that owns them.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from openviking.client.http import AsyncHTTPClient
+from openviking.client.sync_http import SyncHTTPClient
+from openviking.utils import async_utils
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive, so a client reusing them on another loop would fail.
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply({"status": "ok"})
+        elif self.path.startswith("/api/v1/observer/"):
+            self._reply({"status": "ok", "result": {"is_healthy": True}})
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if self.path == "/api/v1/sessions":
+            self._reply({"status": "ok", "result": {"session_id": "s1"}})
+        elif self.path == "/api/v1/sessions/s1/messages":
+            self._reply({"status": "ok", "result": {"session_id": "s1", "message_count": 1}})
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+async def test_sync_observer_and_session_stay_on_caller_loop(server_url):
+    client = AsyncHTTPClient(url=server_url)
+    await client.initialize()
+    try:
+        # Open a keep-alive connection on this loop first.
+        assert await client.health() is True
+
+        assert client.get_status() == {"is_healthy": True}
+        assert client.is_healthy() is True
+
+        session = client.session()
+        assert session.session_id == "s1"
+        result = await session.add_message("user", "hello")
+        assert result["message_count"] == 1
+
+        # The async connection is still usable afterwards.
+        assert await client.health() is True
+    finally:
+        await client.close()
+
+
+@pytest.fixture
+def two_loop_pool(monkeypatch):
+    """Pin the main thread and every other thread to different pooled loops."""
+    monkeypatch.setattr(async_utils, "_pool", async_utils._LoopPool(2))
+    monkeypatch.setattr(
+        async_utils._LoopPool,
+        "_index_for_current_thread",
+        lambda self: 0 if threading.current_thread() is threading.main_thread() else 1,
+    )
+    yield
+    async_utils._pool.shutdown()
+
+
+def test_sync_client_usable_from_another_thread(server_url, two_loop_pool):
+    client = SyncHTTPClient(url=server_url)
+    client.initialize()
+    try:
+        # Keep-alive connection opened from the initializing thread
+        assert client.health() is True
+
+        results = []
+
+        def use_client():
+            message = client.add_message("s1", "user", "hello")
+            results.append((client.health(), message["message_count"]))
+
+        # These threads are pinned to the other pooled loop
+        threads = [threading.Thread(target=use_client) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert results == [(True, 1)] * 4
+    finally:
+        client.close()
@@ -0,0 +1,53 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for lazy attribute loading in the top-level openviking package.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_heavy_modules():
+    """`import openviking` should not import clients, httpx or storage."""
+    out = _run(
+        "import sys, openviking; "
+        "print(any(m in sys.modules for m in "
+        "('httpx', 'openviking.async_client', 'openviking.storage')))"
+    )
+    assert out == "False"
+
+
+def test_lazy_attribute_resolves():
+    """Accessing an exported name imports its module on demand."""
+    import openviking
+
+    assert openviking.OpenViking is openviking.SyncOpenViking
+    assert "AsyncOpenViking" in dir(openviking)
+
+
+def test_unknown_attribute_raises():
+    import openviking
+
+    with pytest.raises(AttributeError):
+        openviking.DoesNotExist  # noqa: B018
+
+
+def test_agfs_client_loaded_on_first_access():
+    """AGFSClient is still exported but pyagfs is only imported when requested."""
+    out = _run(
+        "import sys, openviking; "
+        "before = 'pyagfs' in sys.modules; "
+        "openviking.AGFSClient; "
+        "print(before, 'pyagfs' in sys.modules)"
+    )
+    assert out == "False True"
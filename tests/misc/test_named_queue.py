@@ -0,0 +1,164 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for NamedQueue batch enqueue/dequeue and QueueManager drain.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from openviking.storage.queuefs.embedding_msg import EmbeddingMsg
+from openviking.storage.queuefs.embedding_queue import EmbeddingQueue
+from openviking.storage.queuefs.named_queue import DequeueHandlerBase, NamedQueue
+from openviking.storage.queuefs.queue_manager import QueueManager
+
+
+class FakeQueueFS:
+    """Minimal in-memory stand-in for the AGFS QueueFS plugin."""
+
+    def __init__(self):
+        self.messages = deque()
+        self.writes = 0
+
+    def mkdir(self, path: str) -> None:
+        pass
+
+    def write(self, path: str, data: bytes) -> str:
+        self.writes += 1
+        msg_id = f"id-{self.writes}"
+        self.messages.append({"id": msg_id, "data": data.decode("utf-8")})
+        return msg_id
+
+    def read(self, path: str) -> bytes:
+        if path.endswith("/size"):
+            return str(len(self.messages)).encode("utf-8")
+        if path.endswith("/dequeue"):
+            if not self.messages:
+                return b"{}"
+            return json.dumps(self.messages.popleft()).encode("utf-8")
+        return b""
+
+
+class RecordingHandler(DequeueHandlerBase):
+    def __init__(self):
+        self.batches: List[List[Dict[str, Any]]] = []
+
+    async def on_dequeue(self, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        self.report_success()
+        return data
+
+    async def on_dequeue_batch(self, data_list):
+        self.batches.append(data_list)
+        return [await self.on_dequeue(data) for data in data_list]
+
+
+async def test_enqueue_many_returns_ids_in_order():
+    agfs = FakeQueueFS()
+    queue = NamedQueue(agfs, "/queue", "Test")
+
+    ids = await queue.enqueue_many([{"n": 1}, {"n": 2}, "raw"])
+
+    assert ids == ["id-1", "id-2", "id-3"]
+    assert await queue.size() == 3
+    assert queue.enqueued_total == 3
+
+
+async def test_dequeue_batch_hands_whole_batch_to_handler():
+    agfs = FakeQueueFS()
+    handler = RecordingHandler()
+    queue = NamedQueue(agfs, "/queue", "Test", dequeue_handler=handler)
+    await queue.enqueue_many([{"n": i} for i in range(5)])
+
+    results = await queue.dequeue_batch(max_n=3)
+
+    assert len(results) == 3
+    assert [len(batch) for batch in handler.batches] == [3]
+    status = await queue.get_status()
+    assert status.pending == 2
+    assert status.processed == 3
+    assert status.in_progress == 0
+    assert queue.processed_total == 3
+    assert queue.in_flight == 0
+
+
+async def test_dequeue_batch_returns_partial_batch_after_wait():
+    agfs = FakeQueueFS()
+    queue = NamedQueue(agfs, "/queue", "Test")
+    await queue.enqueue({"n": 1})
+
+    results = await queue.dequeue_batch(max_n=10, max_wait_ms=20)
+
+    assert len(results) == 1
+    assert await queue.dequeue_batch(max_n=10) == []
+
+
+async def test_status_counts_messages_read_into_unfinished_batch():
+    agfs = FakeQueueFS()
+    queue = NamedQueue(agfs, "/queue", "Test", dequeue_handler=RecordingHandler())
+    await queue.enqueue_many([{"n": i} for i in range(3)])
+
+    # The batch waits for more messages, the three read so far are off AGFS already
+    batch = asyncio.ensure_future(queue.dequeue_batch(max_n=10, max_wait_ms=100))
+    await asyncio.sleep(0.02)
+    status = await queue.get_status()
+
+    assert status.pending == 0
+    assert status.in_progress == 3
+    assert not status.is_complete
+
+    await batch
+    status = await queue.get_status()
+    assert status.in_progress == 0
+    assert status.processed == 3
+
+
+async def test_embedding_queue_enqueue_many_skips_none():
+    agfs = FakeQueueFS()
+    queue = EmbeddingQueue(agfs, "/queue", "Embedding")
+    msgs = [EmbeddingMsg(message="a", context_data={}), None, EmbeddingMsg("b", {})]
+
+    ids = await queue.enqueue_many(msgs)
+
+    assert len(ids) == 2
+    assert await queue.size() == 2
+
+
+async def test_queue_manager_drain_waits_for_pending_messages():
+    agfs = FakeQueueFS()
+    manager = QueueManager(agfs_url="http://localhost:0")
+    manager._started = True
+    queue = NamedQueue(agfs, manager.mount_point, "Test")
+    manager._queues["Test"] = queue
+
+    await manager.drain(timeout=1)
+
+    await queue.enqueue({"n": 1})
+    with pytest.raises(TimeoutError):
+        await manager.drain(timeout=0.05, poll_interval=0.01)
+    # Zero means give up at once, not wait forever
+    with pytest.raises(TimeoutError, match="not complete"):
+        await asyncio.wait_for(manager.drain(timeout=0, poll_interval=0.01), timeout=1)
+    manager._started = False
+
+
+def test_queue_manager_stop_abandons_busy_worker_after_timeout():
+    manager = QueueManager(agfs_url="http://localhost:0")
+    manager._started = True
+    release = threading.Event()
+    worker = threading.Thread(target=release.wait, daemon=True)
+    worker.start()
+    manager._queue_threads["Busy"] = worker
+    manager._queue_stop_events["Busy"] = threading.Event()
+
+    start = time.monotonic()
+    manager.stop(timeout=0.05)
+
+    assert time.monotonic() - start < 1
+    assert manager.is_running() is False
+    release.set()
@@ -0,0 +1,59 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests that SyncOpenViking session calls reach storage from the pooled loop.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openviking import AsyncOpenViking, SyncOpenViking
+from openviking.service.session_service import SessionService
+
+
+class _MemoryFS:
+    """In-memory stand-in for the async VikingFS file API used by sessions."""
+
+    def __init__(self):
+        self.files = {}
+
+    async def read_file(self, uri):
+        if uri not in self.files:
+            raise FileNotFoundError(uri)
+        return self.files[uri]
+
+    async def write_file(self, uri, content):
+        self.files[uri] = content
+
+    async def append_file(self, uri, content):
+        self.files[uri] = self.files.get(uri, "") + content
+
+    async def ls(self, uri):
+        raise FileNotFoundError(uri)
+
+
+@pytest.fixture
+def sync_client():
+    AsyncOpenViking._instance = None
+    service = MagicMock()
+    service.initialize = AsyncMock()
+    service.close = AsyncMock()
+    service.sessions = SessionService(viking_fs=_MemoryFS())
+    with patch("openviking.client.local.OpenVikingService", return_value=service):
+        client = SyncOpenViking()
+    client.initialize()
+    yield client
+    client.close()
+    AsyncOpenViking._instance = None
+
+
+def test_session_history_survives_sync_calls(sync_client):
+    session_id = sync_client.create_session()["session_id"]
+
+    sync_client.add_message(session_id, "user", "hello")
+    result = sync_client.add_message(session_id, "assistant", "hi")
+
+    # Each call loads the session from storage, so the count reflects persisted history
+    assert result["message_count"] == 2
+    assert sync_client.get_session(session_id)["message_count"] == 2
@@ -0,0 +1,137 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for TextEmbeddingHandler batch processing pipeline.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openviking.models.embedder.base import EmbedResult
+from openviking.storage.collection_schemas import TextEmbeddingHandler
+from openviking.storage.queuefs.embedding_msg import EmbeddingMsg
+
+
+def _queue_item(message, context_data=None):
+    msg = EmbeddingMsg(message=message, context_data=context_data or {"abstract": "a"})
+    return {"id": msg.id, "data": json.dumps(msg.to_dict())}
+
+
+@pytest.fixture
+def embedder():
+    embedder = MagicMock()
+    embedder.embed_batch.side_effect = lambda texts: [
+        EmbedResult(dense_vector=[0.1, 0.2, 0.3, 0.4]) for _ in texts
+    ]
+    return embedder
+
+
+@pytest.fixture
+def handler(embedder):
+    config = MagicMock()
+    config.storage.vectordb.name = "context"
+    config.embedding.dimension = 4
+    config.embedding.batch_size = 2
+    vikingdb = MagicMock()
+    vikingdb.get_embedder.return_value = embedder
+    vikingdb.is_closing = False
+    vikingdb.batch_insert = AsyncMock(side_effect=lambda collection, data: ["rid"] * len(data))
+    with patch("openviking.utils.config.get_openviking_config", return_value=config):
+        handler = TextEmbeddingHandler(vikingdb, upsert_batch_size=3)
+    handler.on_success = MagicMock()
+    handler.on_error = MagicMock()
+    handler.set_callbacks(handler.on_success, handler.on_error)
+    return handler
+
+
+def test_handler_shares_backend_embedder(handler, embedder):
+    # The backend caches the embedder that warmup() primes, the handler must not build its own
+    assert handler._embedder is embedder
+    handler._vikingdb.get_embedder.assert_called_once_with()
+
+
+async def test_batch_is_embedded_in_chunks(handler, embedder):
+    items = [_queue_item(f"text {i}") for i in range(5)]
+
+    results = await handler.on_dequeue_batch(items)
+
+    assert [len(call.args[0]) for call in embedder.embed_batch.call_args_list] == [2, 2, 1]
+    assert all(result["vector"] == [0.1, 0.2, 0.3, 0.4] for result in results)
+    assert handler.on_success.call_count == 5
+    handler.on_error.assert_not_called()
+
+
+async def test_batch_embed_failure_reports_each_message(handler, embedder):
+    embedder.embed_batch.side_effect = RuntimeError("boom")
+
+    results = await handler.on_dequeue_batch([_queue_item("a"), _queue_item("b")])
+
+    assert results == [None, None]
+    assert handler.on_error.call_count == 2
+
+
+async def test_batch_skips_non_string_messages(handler, embedder):
+    items = [_queue_item([{"type": "image"}]), _queue_item("text")]
+
+    results = await handler.on_dequeue_batch(items)
+
+    assert results[0] == items[0]
+    assert results[1]["vector"] == [0.1, 0.2, 0.3, 0.4]
+    embedder.embed_batch.assert_called_once_with(["text"])
+
+
+async def test_batch_upserts_are_coalesced(handler):
+    items = [_queue_item(f"text {i}") for i in range(7)]
+
+    results = await handler.on_dequeue_batch(items)
+
+    assert all(result is not None for result in results)
+    # Embed chunks of 2 are coalesced into full upserts of 3, the remainder is flushed last
+    written = [len(call.args[1]) for call in handler._vikingdb.batch_insert.call_args_list]
+    assert written == [3, 3, 1]
+
+
+async def test_batch_write_failure_reports_each_message(handler):
+    handler._vikingdb.batch_insert.side_effect = RuntimeError("db down")
+
+    results = await handler.on_dequeue_batch([_queue_item("a"), _queue_item("b")])
+
+    assert results == [None, None]
+    assert handler.on_error.call_count == 2
+    handler.on_success.assert_not_called()
+
+
+async def test_short_embed_result_reports_every_message(handler, embedder):
+    embedder.embed_batch.side_effect = lambda texts: [EmbedResult(dense_vector=[0.1] * 4)]
+
+    results = await asyncio.wait_for(
+        handler.on_dequeue_batch([_queue_item("a"), _queue_item("b")]), timeout=5
+    )
+
+    assert results == [None, None]
+    assert handler.on_error.call_count == 2
+    handler.on_success.assert_not_called()
+
+
+async def test_malformed_embed_result_does_not_stall_pipeline(handler, embedder):
+    embedder.embed_batch.side_effect = lambda texts: [None for _ in texts]
+    items = [_queue_item(f"text {i}") for i in range(5)]
+
+    results = await asyncio.wait_for(handler.on_dequeue_batch(items), timeout=5)
+
+    assert results == [None] * 5
+    assert handler.on_error.call_count == 5
+
+
+async def test_failed_stage_reports_unwritten_messages(handler):
+    handler._write_records = AsyncMock(side_effect=RuntimeError("unexpected"))
+
+    results = await asyncio.wait_for(
+        handler.on_dequeue_batch([_queue_item("a"), _queue_item("b")]), timeout=5
+    )
+
+    assert results == [None, None]
+    assert handler.on_error.call_count == 2
@@ -0,0 +1,305 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for VikingDBManager queue integration.
+"""
+
+import asyncio
+import sys
+import threading
+import types
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from openviking.storage import vikingdb_manager
+from openviking.storage.vikingdb_manager import (
+    VikingDBManager,
+    _NoOpQueue,
+    invalidate_embedder_cache,
+)
+from openviking.utils.config.agfs_config import AGFSConfig
+from openviking.utils.config.vectordb_config import VectorDBBackendConfig
+
+
+@pytest.fixture
+def manager(temp_dir):
+    """VikingDBManager with a mocked queue manager and handlers."""
+    vectordb_config = VectorDBBackendConfig(
+        backend="local", path=str(temp_dir / "vectordb"), dimension=4
+    )
+    mgr = VikingDBManager(vectordb_config=vectordb_config, agfs_config=AGFSConfig())
+    queue_manager = MagicMock()
+    queue_manager.EMBEDDING = "Embedding"
+    queue_manager.SEMANTIC = "Semantic"
+    queue = MagicMock()
+    queue.enqueue = AsyncMock(return_value="msg-id")
+    queue.size = AsyncMock(return_value=3)
+    queue.enqueue_many = AsyncMock(side_effect=lambda msgs: [f"id-{i}" for i in range(len(msgs))])
+    queue.in_flight = 1
+    queue.enqueued_total = 10
+    queue.processed_total = 6
+    queue_manager.get_queue.return_value = queue
+    queue_manager.drain = AsyncMock()
+    mgr._queue_manager = queue_manager
+    with (
+        patch("openviking.storage.collection_schemas.TextEmbeddingHandler") as handler_cls,
+        patch("openviking.storage.queuefs.SemanticProcessor") as processor_cls,
+    ):
+        mgr.handler_cls = handler_cls
+        mgr.processor_cls = processor_cls
+        yield mgr
+
+
+class TestLazyQueues:
+    """Queue handlers are only created on first use."""
+
+    def test_construction_does_not_create_handlers(self, manager):
+        assert manager._queues_initialized is False
+        manager.handler_cls.assert_not_called()
+        manager.processor_cls.assert_not_called()
+        manager._queue_manager.start.assert_not_called()
+
+    async def test_warmup_initializes_queues_once(self, manager):
+        await manager.warmup()
+        await manager.warmup()
+
+        assert manager._queues_initialized is True
+        manager.handler_cls.assert_called_once_with(manager)
+        manager.processor_cls.assert_called_once_with()
+        manager._queue_manager.start.assert_called_once()
+
+    async def test_warmup_primes_embedder(self, manager):
+        embedder = MagicMock()
+        with patch.object(manager, "get_embedder", return_value=embedder):
+            await manager.warmup()
+        embedder.embed.assert_called_once_with("warmup")
+
+    async def test_warmup_tolerates_embedder_failure(self, manager):
+        embedder = MagicMock()
+        embedder.embed.side_effect = RuntimeError("remote down")
+        with patch.object(manager, "get_embedder", return_value=embedder):
+            await manager.warmup()
+        assert manager._queues_initialized is True
+
+    def test_embedding_queue_triggers_init(self, manager):
+        _ = manager.embedding_queue
+        assert manager._queues_initialized is True
+
+
+class TestEmbeddingQueueCache:
+    """The embedding queue is resolved once and reused."""
+
+    async def test_enqueue_uses_cached_queue(self, manager):
+        msg = MagicMock(id="m1")
+        assert await manager.enqueue_embedding_msg(msg) is True
+        assert await manager.enqueue_embedding_msg(msg) is True
+
+        queue = manager.embedding_queue
+        assert queue.enqueue.await_count == 2
+        # One lookup per queue during setup, none on the enqueue path
+        assert manager._queue_manager.get_queue.call_count == 2
+
+    async def test_enqueue_binds_queue_method(self, manager):
+        await manager.warmup()
+        assert manager._enqueue_embedding == manager.embedding_queue.enqueue
+
+    async def test_enqueue_none_is_rejected(self, manager):
+        assert await manager.enqueue_embedding_msg(None) is False
+
+    async def test_enqueue_errors_propagate(self, manager):
+        await manager.warmup()
+        manager.embedding_queue.enqueue.side_effect = ConnectionError("agfs down")
+
+        with pytest.raises(ConnectionError):
+            await manager.enqueue_embedding_msg(MagicMock(id="m1"))
+
+    async def test_get_embedding_queue_size(self, manager):
+        assert await manager.get_embedding_queue_size() == 3
+
+    async def test_close_drops_cached_queue(self, manager):
+        await manager.warmup()
+        await manager.close()
+        assert isinstance(manager._embedding_queue_cached, _NoOpQueue)
+
+
+class TestWithoutAGFS:
+    """Without an AGFS URL, queue calls are accepted and dropped."""
+
+    @pytest.fixture
+    def local_manager(self, temp_dir):
+        vectordb_config = VectorDBBackendConfig(
+            backend="local", path=str(temp_dir / "vectordb"), dimension=4
+        )
+        return VikingDBManager(vectordb_config=vectordb_config, agfs_config=AGFSConfig(url=""))
+
+    async def test_enqueue_is_dropped(self, local_manager):
+        assert local_manager.has_queue_manager is False
+        assert await local_manager.enqueue_embedding_msg(MagicMock(id="m1")) is False
+        assert await local_manager.enqueue_embedding_msgs([MagicMock(id="m2")]) == 0
+        assert await local_manager.get_embedding_queue_size() == 0
+
+
+class TestBatchEnqueue:
+    async def test_enqueue_embedding_msgs_single_call(self, manager):
+        msgs = [MagicMock(id=f"m{i}") for i in range(3)]
+
+        assert await manager.enqueue_embedding_msgs(msgs) == 3
+        manager.embedding_queue.enqueue_many.assert_awaited_once_with(msgs)
+
+
+class TestGracefulClose:
+    async def test_close_drains_before_stop(self, manager):
+        await manager.warmup()
+        queue_manager = manager._queue_manager
+        calls = []
+        queue_manager.drain.side_effect = lambda timeout: calls.append(("drain", timeout))
+        queue_manager.stop.side_effect = lambda timeout: calls.append(("stop",))
+
+        await manager.close(timeout=5.0)
+
+        assert calls == [("drain", 5.0), ("stop",)]
+
+    async def test_close_stops_on_drain_timeout(self, manager):
+        await manager.warmup()
+        queue_manager = manager._queue_manager
+        queue_manager.drain.side_effect = TimeoutError()
+
+        await manager.close(timeout=0.1)
+
+        queue_manager.stop.assert_called_once()
+        assert queue_manager.stop.call_args.kwargs["timeout"] <= 0.1
+
+    async def test_close_not_graceful_skips_drain(self, manager):
+        await manager.warmup()
+        queue_manager = manager._queue_manager
+
+        await manager.close(graceful=False)
+
+        queue_manager.drain.assert_not_awaited()
+        queue_manager.stop.assert_called_once()
+
+    async def test_enqueue_rejected_while_closing(self, manager):
+        await manager.warmup()
+        queue = manager.embedding_queue
+        manager._closing = True
+
+        assert await manager.enqueue_embedding_msg(MagicMock(id="m1")) is False
+        assert await manager.enqueue_embedding_msgs([MagicMock(id="m2")]) == 0
+        queue.enqueue.assert_not_awaited()
+
+
+class TestAsyncContextManager:
+    async def test_async_with_closes_gracefully(self, manager):
+        with patch.object(manager, "close", AsyncMock()) as close:
+            async with manager as mgr:
+                assert mgr is manager
+        close.assert_awaited_once_with(graceful=True)
+
+    async def test_async_with_closes_on_error(self, manager):
+        with patch.object(manager, "close", AsyncMock()) as close:
+            with pytest.raises(ValueError):
+                async with manager:
+                    raise ValueError("boom")
+        close.assert_awaited_once()
+
+
+class TestQueueStats:
+    async def test_queue_stats_before_init_is_empty(self, manager):
+        assert await manager.queue_stats() == {}
+
+    async def test_queue_stats_reports_each_queue(self, manager):
+        await manager.warmup()
+
+        stats = await manager.queue_stats()
+
+        expected = {"size": 3, "in_flight": 1, "enqueued": 10, "processed": 6}
+        assert stats == {"embedding": expected, "semantic": expected}
+
+    async def test_queue_gauges_tolerate_duplicate_registration(self, manager, monkeypatch):
+        registered = {}
+
+        class Gauge:
+            def __init__(self, name, documentation, labelnames):
+                if name in registered:
+                    raise ValueError(f"Duplicated timeseries in CollectorRegistry: {name}")
+                registered[name] = self
+                self.values = {}
+
+            def labels(self, queue):
+                return types.SimpleNamespace(set=lambda v: self.values.__setitem__(queue, v))
+
+        fake = types.ModuleType("prometheus_client")
+        fake.Gauge = Gauge
+        monkeypatch.setitem(sys.modules, "prometheus_client", fake)
+
+        gauges = vikingdb_manager._register_queue_gauges()
+        # A second import of the module must not raise
+        assert vikingdb_manager._register_queue_gauges() is None
+        assert sorted(registered) == [
+            "openviking_queue_enqueued",
+            "openviking_queue_in_flight",
+            "openviking_queue_processed",
+            "openviking_queue_size",
+        ]
+
+        monkeypatch.setattr(vikingdb_manager, "_QUEUE_GAUGES", gauges)
+        await manager.warmup()
+        await manager.queue_stats()
+        assert gauges["processed"].values == {"embedding": 6, "semantic": 6}
+
+    async def test_heartbeat_reads_stats_off_the_loop(self, manager, monkeypatch):
+        threads = []
+
+        async def size():
+            threads.append(threading.current_thread())
+            manager._closing = True
+            return 0
+
+        await manager.warmup()
+        # Drive the heartbeat directly instead of waiting for the scheduled one
+        manager._heartbeat.cancel()
+        manager._queue_manager.get_queue.return_value.size = size
+        monkeypatch.setattr(manager, "QUEUE_HEARTBEAT_INTERVAL", 0)
+        with patch.object(vikingdb_manager.logger, "isEnabledFor", return_value=True):
+            await asyncio.wait_for(manager._queue_heartbeat(), timeout=5)
+
+        assert threads and threading.current_thread() not in threads
+
+    async def test_close_cancels_heartbeat(self, manager):
+        await manager.warmup()
+        heartbeat = manager._heartbeat
+
+        await manager.close(graceful=False)
+
+        assert heartbeat.cancelled()
+        assert manager._heartbeat is None
+
+
+class TestEmbedderCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        invalidate_embedder_cache()
+        yield
+        invalidate_embedder_cache()
+
+    def test_embedder_built_once_until_invalidated(self, manager):
+        config = MagicMock()
+        config.embedding.get_embedder.side_effect = lambda: object()
+        with patch(
+            "openviking.storage.vikingdb_manager.get_openviking_config", return_value=config
+        ):
+            first = manager.get_embedder()
+            assert manager.get_embedder() is first
+            invalidate_embedder_cache()
+            assert manager.get_embedder() is not first
+        assert config.embedding.get_embedder.call_count == 2
+
+    def test_embedder_failure_is_not_cached(self, manager):
+        config = MagicMock()
+        config.embedding.get_embedder.side_effect = [ValueError("no config"), "embedder"]
+        with patch(
+            "openviking.storage.vikingdb_manager.get_openviking_config", return_value=config
+        ):
+            assert manager.get_embedder() is None
+            assert manager.get_embedder() == "embedder"